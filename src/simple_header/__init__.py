@@ -5,8 +5,8 @@ Generate ready-to-use headers for a web request with the least chance of
 being blocked by anti-scraping techniques applied by websites. The
 headers are based on the most common headers of browsers and operating
 systems, and are ordered in the right way (servers check for that).
-The inspect_headers.py file contains a Flask app to validate which
-headers your browser or scraper sends.
+The scripts/inspect_headers.py file in the repository contains a Flask
+app to validate which headers your browser or scraper sends.
 
 # Import the package.
 import simple_header as sh
@@ -23,17 +23,23 @@ header.connection >> 'keep-alive'
 header.user_agent.string >> 'Mozilla/5.0 ...'
 header.user_agent.os >> 'Windows'
 
-# Get a list of 10 Header instances sorted by plausibility with
-# different seeds/header combinations, but the same given user agent:
+# Get a list of 10 Header instances with different seeds/header
+# combinations, ranked by the number of header values deviating from the
+# most common ones, but all with the same given user agent:
 sh.get_list(url="https...", num=10, user_agent="Mozilla/5...")
 >> [Header(...), Header(...), ...]
 
 # Get a ready-to-use header dict with overwritten language detection
 # from TLD (.com = 'en-US' -> 'de-DE'). The seed of 3 will give the
-# third most plausible header combination to avoid detection:
+# fourth header combination of this ranking to avoid detection:
 sh.get_dict(url="https...com", language="de-DE", seed=3)
 >> {'User-Agent': 'Mozilla/5.0 ...', 'Host': 'www.example.com', ...}
 
+# Get ready-to-use header dicts for multiple urls at once, all with the
+# same (random) user agent:
+sh.get_dicts(urls=["https://www.example.com", "https://www.example.de"])
+>> [{'User-Agent': 'Mozilla/5.0 ...', ...}, {'User-Agent': ...}]
+
 # Fetch the two most common mobile user agent instances (see the README
 # of simple-useragent for full documentation):
 sh.sua.get(num=2, shuffle=False, mobile=True)
@@ -53,7 +59,48 @@ __status__ = "Development"
 __github__ = "https://github.com/Lennolium/simple-header"
 
 # Imports.
-from .core import Header, Headers, get, get_dict, get_list, sua, exceptions
+from . import exceptions
+
+__all__ = ("Header", "Headers", "get", "get_dict", "get_dicts", "get_list",
+           "sua", "exceptions")
+
+
+def __getattr__(name: str):
+    """
+    Lazily import the core module (and with it simple-useragent and the
+    header templates) on first access of it or one of its public names
+    (PEP 562), so importing the package itself stays cheap.
+
+    :param name: The name of the accessed attribute.
+    :type name: str
+    :return: The core module or one of its attributes.
+    :rtype: object
+    """
+
+    # Imported by name, as 'from . import core' would look up the
+    # attribute 'core' and end up here again.
+    if name == "core":
+        import importlib
+
+        return importlib.import_module(f"{__name__}.core")
+
+    if name in __all__:
+        from . import core
+
+        value = getattr(core, name)
+        globals()[name] = value
+
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """
+    List the module attributes including the lazily imported ones.
+
+    :return: The sorted attribute names.
+    :rtype: list[str]
+    """
 
-__all__ = ("Header", "Headers", "get", "get_dict", "get_list", "sua",
-           "exceptions")
+    return sorted(set(globals()) | set(__all__))
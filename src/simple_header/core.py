@@ -15,18 +15,20 @@ user agent, you have to set the mobile parameter. For country-specific
 headers, we auto-detect the language from the TLD of the url. If you
 want to overwrite it, you can pass the ISO language code (e.g. 'en-US',
 'en-AU', 'de-DE', ...). The seed is used for getting different header
-value combinations with reproducible results. Maximal 720 different
-header value combinations are possible. I recommend you start by using
-the get_list function with num of 10 to get a list of 10 Header
-instances with the same user agent but different seeds/header
-combinations, ordered by their plausibility of being accepted as
-legitimate browser by the server. Each Header instance has a dictionary
-with the headers as key-value pairs in the right ordering (servers check
-for that, even if the web standards say it should not be important),
-ready to use in a request by using the instances dict attribute or
-__dict__ method. The modules get_dict function directly returns a single
-ready to use dictionary with the headers for a request. The inspect.py
-file contains a Flask app to validate which headers your browser sends.
+value combinations with reproducible results. The 48 combinations are
+ranked once at import by the number of header values deviating from the
+most common ones, seed n selects the (n+1)-th one (larger seeds wrap
+around). I recommend you start by using the get_list function with num
+of 10 to get a list of 10 Header instances with the same user agent but
+different seeds/header combinations, starting with the most common
+header values. Each Header instance has a dictionary with the headers
+as key-value pairs in the right ordering (servers check for that, even
+if the web standards say it should not be important), ready to use in a
+request by using the instances dict attribute or as_dict method. The
+modules get_dict function directly returns a single ready to use
+dictionary with the headers for a request. The
+scripts/inspect_headers.py file in the repository contains a Flask app
+to validate which headers your browser sends.
 """
 from __future__ import annotations
 
@@ -40,16 +42,20 @@ __status__ = "Development"
 __github__ = "https://github.com/Lennolium/simple-header"
 
 # Imports.
+import copy
+import functools
+import itertools
 import json
 import logging
 import os.path
 import pathlib
 import random
 import re
+import types
+import urllib.parse
+from typing import Iterable
 
 import simple_useragent as sua
-import tldextract
-import validators
 
 from simple_header import exceptions
 
@@ -58,12 +64,487 @@ LOGGER = logging.getLogger(__name__)
 logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 
 
+# Template files shipped in the 'data' folder of the package.
+_DATA_DIR = pathlib.Path(os.path.dirname(__file__), "data")
+_HEADER_TEMPLATES_JSON = "header_templates.json"
+_REFERER_TEMPLATES_JSON = "referer_templates.json"
+
+
+def _freeze(
+        value: object
+        ) -> object:
+    """
+    Convert parsed json into read-only containers, recursively: objects
+    to read-only mappings and arrays to tuples.
+
+    :param value: The parsed json value.
+    :type value: object
+    :return: The read-only json value.
+    :rtype: object
+    """
+
+    if isinstance(value, dict):
+        return types.MappingProxyType(
+                {key: _freeze(item) for key, item in value.items()}
+                )
+
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json(
+        file_name: str
+        ) -> types.MappingProxyType:
+    """
+    Load a json file from the 'data' folder. The file is parsed only
+    once per process, the result is cached and shared between calls,
+    so it is returned read-only, including all nested values.
+
+    :param file_name: The name of the json file.
+    :type file_name: str
+    :return: The json file as a read-only dictionary.
+    :rtype: types.MappingProxyType
+    """
+
+    fp = _DATA_DIR / file_name
+
+    # Open templates from json file.
+    try:
+        with open(fp, "r") as fh:
+            return _freeze(json.load(fh))
+
+    except Exception as e:
+        LOGGER.error(f"Could not find template file, that is shipped "
+                     f"with the package! Verify that the file exists "
+                     f"and if it does, report the issue please.\n"
+                     f"{str(e.__class__.__name__)}: {str(e)}"
+                     )
+        raise exceptions.TemplateNotFoundError(
+                f"Could not find template file, that is shipped"
+                f"with the package! Verify that the file exists "
+                f"and if it does, report the issue please.\n"
+                f"{str(e.__class__.__name__)}: {str(e)}"
+                )
+
+
+def _normalize_language(
+        language: str
+        ) -> str:
+    """
+    Normalize a language code for the lookup of its canonical form
+    ('en-US', 'EN-us' and 'enUS' -> 'enus'). Only the dash between
+    language and country code is removed, so malformed codes like
+    '-de-DE', 'en-US-' or 'de-' do not match any canonical form.
+
+    :param language: The language code.
+    :type language: str
+    :return: The lowercase language code without separator dash.
+    :rtype: str
+    """
+
+    language = language.lower()
+
+    # Language and country code separated by a dash: 'en-us' -> 'enus'.
+    if len(language) == 5 and language[2] == "-":
+        return language[:2] + language[3:]
+
+    return language
+
+
+# TLD to language lookup table ('com.au' -> 'en-AU'), built once at
+# import. The maximal number of labels of a TLD limits the lookups.
+_TLD_LANG = {
+        tld: values[0] for tld, values in
+        _load_json(_REFERER_TEMPLATES_JSON).items() if tld
+        }
+_TLD_MAX_LABELS = max(tld.count(".") + 1 for tld in _TLD_LANG)
+
+# Common referers of every TLD, without the language in the first entry
+# of the referer json ('de' -> ('https://www.google.de/', ...)).
+_TLD_REFERERS = {
+        tld: tuple(values[1:]) for tld, values in
+        _load_json(_REFERER_TEMPLATES_JSON).items()
+        }
+
+# Reverse lookup tables, the first TLD/language in the referer json wins:
+# Lowercase language code to TLD ('en-au' -> 'com.au') and the accepted
+# spellings of a language code, normalized to lowercase without the
+# separator dash, to the canonical one ('enus' and 'en' -> 'en-US').
+_LANG_TLD = {}
+_NORMALIZED_LANG = {}
+for _tld, _values in _load_json(_REFERER_TEMPLATES_JSON).items():
+    _LANG_TLD.setdefault(_values[0].lower(), _tld)
+    for _spelling in (_values[0], _values[0][:2]):
+        _NORMALIZED_LANG.setdefault(_normalize_language(_spelling), _values[0])
+del _tld, _values, _spelling
+
+# Header values with a single plausible value, shared by every generated
+# header.
+_CONNECTION = "keep-alive"
+_CACHE_CONTROL = "max-age=0"
+# Request made by user ('?1') or by script (omitted).
+_SEC_FETCH_USER = "?1"
+# Sec-Ch-Ua-Mobile of mobile and desktop user agents.
+_MOBILE_TRUE = "?1"
+_MOBILE_FALSE = "?0"
+# Upgrade-Insecure-Requests of http and https urls.
+_UIR_HTTP = "0"
+_UIR_HTTPS = "1"
+
+# Plain http(s) url with a domain name, optional port (1-65535) and
+# path. Only used to accept common urls without calling validators, so
+# it must never accept an url validators rejects. Urls with a query or
+# fragment are always checked by validators.
+_URL_FAST_RE = re.compile(
+        r"https?://(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}"
+        r"(?::(?:6553[0-5]|655[0-2]\d|65[0-4]\d{2}|6[0-4]\d{3}|[1-5]\d{4}"
+        r"|[1-9]\d{0,3}))?"
+        r"(?:/[\w\-.~!$&'()*+,;=:@%/]*)?",
+        re.IGNORECASE | re.ASCII
+        )
+
+# Random source for the referer selection, created once.
+_SYSTEM_RANDOM = random.SystemRandom()
+
+# Chromium major version in the user agent string of Chrome-based
+# browsers and of Chrome on iOS devices.
+_CHROME_VERSION_RE = re.compile(r'Chrome/(\d+)\.\d+\.\d+\.\d+')
+_CRIOS_VERSION_RE = re.compile(r'CriOS/(\d+)\.\d+\.\d+\.\d+')
+
+# Browsers without Sec-Ch-Ua headers.
+_NO_SEC_CH_UA_BROWSERS = frozenset(("Safari", "Firefox", "IE"))
+
+# Browser specific Sec-Ch-Ua header templates, filled with the Chromium
+# and the browser version. Chrome is also the fallback for others.
+_SEC_CH_UA_TEMPLATES = {
+        "Opera": ('"Not_A Brand";v="8", '
+                  '"Chromium";v="{chromium}", '
+                  '"Opera";v="{browser_version}"'),
+        "Edge": ('"Not A(Brand";v="99", '
+                 '"Microsoft Edge";v="{browser_version}", '
+                 '"Chromium";v="{chromium}"'),
+        "Whale": ('"Whale";v="{browser_version}", '
+                  '"Not-A.Brand";v="8", '
+                  '"Chromium";v="{chromium}"'),
+        "QQ Browser": ('"Not A;Brand";v="{browser_version}", '
+                       '"Chromium";v="{chromium}", '
+                       '"QQ Browser";v="{browser_version}"'),
+        "Samsung Browser": ('"Not?A_Brand";v="{browser_version}", '
+                            '"Chromium";v="{chromium}", '
+                            '"Samsung Browser";v="{browser_version}"'),
+        "Chrome": ('"Not A(Brand";v="99", '
+                   '"Chromium";v="{chromium}", '
+                   '"Google Chrome";v="{browser_version}"'),
+        }
+
+# Os of the default template for unknown os/browser combinations,
+# indexed by the mobile flag: desktop (False) -> 0, mobile (True) -> 1.
+_FALLBACK_OS = ("Windows", "Android")
+
+# Header values with multiple plausible variants, most common first.
+# Direct request: 'none', dynamic data request (XHR): 'none'.
+_SEC_FETCH_SITE = ("none", "same-site")
+# Direct request: 'navigate', XHR: 'cors' or 'same-origin'.
+_SEC_FETCH_MODE = ("navigate", "same-origin", "cors")
+# Direct html request: 'document', XHR: 'empty'.
+_SEC_FETCH_DEST = ("document", "empty")
+# Sometimes 'br' is used to identify a scraper.
+_ACCEPT_ENCODING = ("gzip, deflate", "gzip, deflate, br")
+# Quality value of the primary language in the Accept-Language header.
+_ACCEPT_LANGUAGE_QUALITIES = ("0.5", "0.9")
+
+
+def _accept_languages(
+        language: str
+        ) -> tuple[str, ...]:
+    """
+    Build the Accept-Language header variants for a language code.
+
+    :param language: The language code (e.g. 'en-US').
+    :type language: str
+    :return: The header values, one per quality value.
+    :rtype: tuple[str, ...]
+    """
+
+    return tuple(f"{language},{language[:2]};q={quality}"
+                 for quality in _ACCEPT_LANGUAGE_QUALITIES)
+
+
+# Accept-Language variants of every supported language, built once at
+# import ('de-DE' -> ('de-DE,de;q=0.5', 'de-DE,de;q=0.9')).
+_ACCEPT_LANGUAGE = {
+        language: _accept_languages(language)
+        for language in set(_TLD_LANG.values())
+        }
+
+# Instance attributes varied by the seed, in the order of the variant
+# indices in a combination.
+_SEED_ATTRS = (
+        "sec_fetch_site",
+        "sec_fetch_mode",
+        "sec_fetch_dest",
+        "accept_encoding",
+        "accept_language",
+        )
+
+# Variant indices of the attributes varied by the seed, for every
+# combination. Ranked by the number of values deviating from the most
+# common variant (index 0), ties keep their lexicographic order. Seed 0
+# (or None) selects the most common values, larger seeds wrap around.
+_COMBINATIONS = tuple(sorted(
+        itertools.product(*(range(len(pool)) for pool in (
+                _SEC_FETCH_SITE,
+                _SEC_FETCH_MODE,
+                _SEC_FETCH_DEST,
+                _ACCEPT_ENCODING,
+                _ACCEPT_LANGUAGE_QUALITIES,
+                ))),
+        key=lambda indices: sum(map(bool, indices))
+        ))
+_NUM_COMBINATIONS = len(_COMBINATIONS)
+
+
+# Actions of a template plan step, how the value of a header is filled.
+_FROM_TEMPLATE = 0  # Value defined in the template (Accept).
+_FROM_USER_AGENT = 1  # The user agent string.
+_FROM_REFERER = 2  # Url without path or a random referer.
+_FROM_VARIANTS = 3  # Variant of the seeded combination.
+_FROM_ATTR = 4  # Single valued instance attribute.
+
+
+def _template_plan(
+        template: dict[str, str]
+        ) -> tuple[tuple[str, ...], tuple[tuple[int, str], ...]]:
+    """
+    Classify every header of a template once into the action filling its
+    value and its argument (template value or instance attribute name),
+    so generate() does not inspect the header keys on every call.
+
+    :param template: The header template of an os and browser.
+    :type template: dict[str, str]
+    :return: The header keys in template order and the action and
+        argument of each header.
+    :rtype: tuple[tuple[str, ...], tuple[tuple[int, str], ...]]
+    """
+
+    steps = []
+    for key, value in template.items():
+        attr_name = key.lower().replace("-", "_")
+
+        if key == "Accept":
+            steps.append((_FROM_TEMPLATE, value))
+        elif key == "User-Agent":
+            steps.append((_FROM_USER_AGENT, attr_name))
+        elif key == "Referer":
+            steps.append((_FROM_REFERER, attr_name))
+        elif attr_name in _SEED_ATTRS:
+            steps.append((_FROM_VARIANTS, attr_name))
+        else:
+            steps.append((_FROM_ATTR, attr_name))
+
+    return tuple(template), tuple(steps)
+
+
+# Plan of every header template, keyed by (os, browser), built once at
+# import.
+_TEMPLATE_PLANS = {
+        (os_name, browser): _template_plan(template)
+        for os_name, browsers in _load_json(_HEADER_TEMPLATES_JSON).items()
+        for browser, template in browsers.items()
+        }
+
+
+@functools.lru_cache(maxsize=2048)
+def _split_url(
+        url: str
+        ) -> urllib.parse.SplitResult:
+    """
+    Split the url into its components and cache the result, as the
+    host, TLD and referer are all derived from the same url.
+
+    :param url: The url to split.
+    :type url: str
+    :return: The components of the url.
+    :rtype: urllib.parse.SplitResult
+    """
+
+    return urllib.parse.urlsplit(url)
+
+
+def _validate_url(
+        url: str
+        ) -> bool:
+    """
+    Validate the url with the stricter validators package. It is only
+    imported on first use, as the fast regex already accepts most urls.
+
+    :param url: The url to validate.
+    :type url: str
+    :return: True if the url is valid.
+    :rtype: bool
+    """
+
+    import validators
+
+    return bool(validators.url(url))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_user_agent(
+        user_agent: str
+        ) -> tuple[tuple[str, str | bool | None], ...]:
+    """
+    Parse a user agent string and cache the parsed attributes, as the
+    regex based parsing is the most expensive part of the header
+    generation and scrapers pass the same few strings over and over.
+    The attributes are cached as immutable tuple, so a cached result
+    can not be modified by the caller.
+
+    :param user_agent: The user agent string to parse.
+    :type user_agent: str
+    :return: The attribute names and values of the parsed user agent.
+    :rtype: tuple[tuple[str, str | bool | None], ...]
+    """
+
+    return tuple(sua.parse(user_agent).__dict__().items())
+
+
+def _user_agent_from_string(
+        user_agent: str
+        ) -> sua.UserAgent:
+    """
+    Create a new UserAgent object from the cached parsed attributes of
+    the user agent string, without parsing it again.
+
+    :param user_agent: The user agent string to parse.
+    :type user_agent: str
+    :return: The new user agent object.
+    :rtype: sua.UserAgent
+    """
+
+    parsed = sua.UserAgent.__new__(sua.UserAgent)
+    for attr, value in _parse_user_agent(user_agent):
+        setattr(parsed, attr, value)
+
+    return parsed
+
+
+def _sec_ch_ua_chromium(
+        user_agent_string: str,
+        browser_version: str,
+        ) -> str:
+    """
+    Extract the Chromium version from the user agent string.
+
+    :param user_agent_string: The user agent string.
+    :type user_agent_string: str
+    :param browser_version: The browser version used as fallback.
+    :type browser_version: str
+    :return: The Chromium version or the browser version as
+        fallback.
+    :rtype: str
+    """
+
+    version = _CHROME_VERSION_RE.search(user_agent_string)
+
+    # Fallback for Chrome on some iOS devices.
+    if not version:
+        version = _CRIOS_VERSION_RE.search(user_agent_string)
+
+    return version.group(1) if version else browser_version
+
+
+@functools.lru_cache(maxsize=1024)
+def _sec_ch_ua(
+        user_agent_string: str,
+        browser: str,
+        browser_version: str,
+        os: str,
+        mobile: bool,
+        ) -> (tuple[str, str, str] |
+              tuple[None, None, None]):
+    """
+    Generate the Sec-Ch-Ua headers for Chrome and Chromium based
+    browsers. For other browsers we return None. The result only
+    depends on the user agent, so it is cached for repeated user agents
+    (e.g. all instances of get_list).
+
+    :param user_agent_string: The user agent string.
+    :type user_agent_string: str
+    :param browser: The browser of the user agent.
+    :type browser: str
+    :param browser_version: The browser version of the user agent.
+    :type browser_version: str
+    :param os: The os of the user agent.
+    :type os: str
+    :param mobile: If the user agent is a mobile one.
+    :type mobile: bool
+    :return: A tuple with the Sec-Ch-Ua, Sec-Ch-Ua-Mobile and
+        Sec-Ch-Ua-Platform or None for unsupported browsers and os.
+    :rtype: tuple[str, str, str] | tuple[None, None, None]
+    """
+
+    # IE, Firefox and Safari do not send Sec-Ch-Ua headers.
+    if browser in _NO_SEC_CH_UA_BROWSERS:
+        return None, None, None
+
+    # Always the same for all browsers.
+    sec_ch_ua_mobile = _MOBILE_TRUE if mobile else _MOBILE_FALSE
+    sec_ch_ua_platform = os
+
+    # For Chrome-based browsers we need to extract Chromium version.
+    ua_chromium_version = _sec_ch_ua_chromium(
+            user_agent_string=user_agent_string,
+            browser_version=browser_version,
+            )
+
+    # Browser specific sec-ch-ua string. Chrome, Chromium and fallback
+    # for others.
+    sec_ch_ua = _SEC_CH_UA_TEMPLATES.get(
+            browser, _SEC_CH_UA_TEMPLATES["Chrome"]
+            ).format(chromium=ua_chromium_version,
+                     browser_version=browser_version
+                     )
+
+    return sec_ch_ua, sec_ch_ua_mobile, sec_ch_ua_platform
+
+
 class Header:
     """
     Class to generate headers for a request with right orderings and
     values to avoid anti-scraping techniques applied by websites.
     """
 
+    # Fixed attribute layout without a per-instance __dict__, as
+    # get_list returns many instances at once.
+    __slots__ = (
+            "url",
+            "language",
+            "mobile",
+            "seed",
+            "intra_site_nav",
+            "host",
+            "connection",
+            "cache_control",
+            "sec_ch_ua",
+            "sec_ch_ua_mobile",
+            "sec_ch_ua_platform",
+            "upgrade_insecure_requests",
+            "user_agent",
+            "accept",
+            "sec_fetch_site",
+            "sec_fetch_mode",
+            "sec_fetch_dest",
+            "sec_fetch_user",
+            "referer",
+            "accept_encoding",
+            "accept_language",
+            "dict",
+            )
+
     def __init__(
             self,
             url: str,
@@ -90,9 +571,10 @@ class Header:
         :param mobile: If the request should look like it was made from
             a mobile device.
         :type mobile: bool
-        :param seed: Seed for random headers values (if multiple values
-            are available). If None, the first and most common value is
-            used.
+        :param seed: Seed for header values (if multiple values are
+            available). Selects the (seed+1)-th value combination,
+            ranked by the number of values deviating from the most
+            common ones. If None, the most common values are used.
         :type seed: int
         :param intra_site_nav: If the request is made from the same site
             (intra-site navigation). If True, the referer is the url
@@ -137,7 +619,8 @@ class Header:
                 url=url,
                 language=language,
                 user_agent=user_agent,
-                mobile=mobile
+                mobile=mobile,
+                seed=seed,
                 )
         self.seed = seed
 
@@ -154,7 +637,7 @@ class Header:
                 _internal=True
                 )
 
-    def __dict__(self) -> dict[str, str]:
+    def as_dict(self) -> dict[str, str]:
         """
         Returns the browser headers in a dictionary, ready to use for a
         request.
@@ -229,50 +712,15 @@ class Header:
                     f"{item}'."
                     )
 
-    @staticmethod
-    def __load_json(
-            file_name: str
-            ) -> json:
-        """
-        Load a json file from the 'data' folder.
-
-        :param file_name: The name of the json file.
-        :type file_name: str
-        :return: The json file as a dictionary.
-        :rtype: json
-        """
-
-        fp = pathlib.Path(os.path.dirname(__file__),
-                          "data",
-                          file_name
-                          )
-
-        # Open templates from json file.
-        try:
-            with open(fp, "r") as fh:
-                return json.load(fh)
-
-        except Exception as e:
-            LOGGER.error(f"Could not find template file, that is shipped "
-                         f"with the package! Verify that the file exists "
-                         f"and if it does, report the issue please.\n"
-                         f"{str(e.__class__.__name__)}: {str(e)}"
-                         )
-            raise exceptions.TemplateNotFoundError(
-                    f"Could not find template file, that is shipped"
-                    f"with the package! Verify that the file exists "
-                    f"and if it does, report the issue please.\n"
-                    f"{str(e.__class__.__name__)}: {str(e)}"
-                    )
-
     def __detect_language(
             self,
             url: str,
             ) -> str:
         """
         Detect the language of the website from the TLD of the passed
-        url. If the TLD is not in the referer json, we fall back to
-        'com'.
+        url. We look up the longest known TLD first, so 'example.com.au'
+        is matched by 'com.au' before 'au'. If the TLD is not in the
+        referer json, we fall back to 'com'.
 
         :param url: The url to scrape.
         :type url: str
@@ -280,18 +728,21 @@ class Header:
         :rtype: str
         """
 
-        tld = tldextract.extract(url).suffix
-        referer_json = self.__load_json("referer_templates.json")
+        labels = (_split_url(url).hostname or "").split(".")
 
-        # Sanitize and format TLD input for referer.
-        if tld not in referer_json.keys() or not tld:
-            LOGGER.warning(
-                    f"Could not auto-detect language for TLD '{tld}'! "
-                    f"Falling back to to standard language 'en-US'."
-                    )
-            tld = "com"
+        # Multi-label TLDs first: 'co.uk' -> 'en-GB', 'uk' -> None. The
+        # hostname may be a bare TLD itself ('https://com.au').
+        for num in range(min(_TLD_MAX_LABELS, len(labels)), 0, -1):
+            language = _TLD_LANG.get(".".join(labels[-num:]))
+            if language:
+                return language
+
+        LOGGER.warning(
+                f"Could not auto-detect language for TLD '{labels[-1]}'! "
+                f"Falling back to to standard language 'en-US'."
+                )
 
-        return referer_json[tld][0]
+        return _TLD_LANG["com"]
 
     def __check_language(
             self,
@@ -311,25 +762,16 @@ class Header:
         :rtype: str
         """
 
-        referer_json = self.__load_json("referer_templates.json")
-
         # No language code passed -> we detect language from the TLD.
         if not language:
             return self.__detect_language(url=url)
 
-        # Language code passed -> we check if it is in the referer json.
-        for value in referer_json.values():
-            # Exact match: 'en-US' -> 'en-US'.
-            if language.lower() == value[0].lower():
-                return value[0]
-
-            # Language code without country code: 'en' -> 'en-US'.
-            elif language.lower() == value[0][:2].lower():
-                return value[0]
-
-            # No dash in language code: 'enUS' -> 'en-US'.
-            elif language.lower() == value[0].replace("-", "").lower():
-                return value[0]
+        # Language code passed -> we look up its canonical form. Exact
+        # match: 'en-US', without country code: 'en' and without dash:
+        # 'enUS' -> 'en-US'.
+        canonical = _NORMALIZED_LANG.get(_normalize_language(language))
+        if canonical:
+            return canonical
 
         # Language code not recognized or supported.
         LOGGER.warning(
@@ -364,7 +806,7 @@ class Header:
 
         # If string is passed, we parse it to an UserAgent object.
         elif isinstance(user_agent, str):
-            return sua.parse(user_agent)
+            return _user_agent_from_string(user_agent)
 
         elif user_agent is None:
             LOGGER.info("No user agent passed. Generating a random one.")
@@ -385,11 +827,12 @@ class Header:
             language: str,
             user_agent: sua.UserAgent | str,
             mobile: bool,
+            seed: int | None = None,
             ) -> tuple[str, str, sua.UserAgent, bool]:
         """
         Validate all input parameters and return them in the right
-        format. If a wrong type or invalid value for the url is passed,
-        an exception is raised.
+        format. If a wrong type or invalid value for the url or seed is
+        passed, an exception is raised.
 
         :param url: The url to scrape.
         :type url: str
@@ -399,18 +842,33 @@ class Header:
         :type user_agent: str | sua.UserAgent
         :param mobile: If the request should look like it was made from
             a mobile device. Only used if no user agent is passed.
+        :param seed: Seed for header values or None.
+        :type seed: int | None
         :return: The validated input parameters.
         :rtype: tuple[str, str, sua.UserAgent, bool]
         """
 
-        # Validate the passed url -> if not valid, return None.
-        if not validators.url(url) or not isinstance(url, str):
+        # Validate the passed url -> if not valid, return None. Common
+        # well-formed urls are accepted by the fast regex, all others
+        # are checked by the stricter validators package.
+        if not isinstance(url, str) or not (_URL_FAST_RE.fullmatch(url)
+                                            or _validate_url(url)):
             msg = (f"URL '{url}' is not a str or invalid! "
                    f"No {self.__class__.__name__} instance created. "
                    f"Valid example: 'https://www.example.com/site.html'.")
             LOGGER.error(msg)
             raise exceptions.InvalidURLError(msg)
 
+        # Validate the passed seed -> it selects a header value
+        # combination by index, so only integers (no bools) are valid.
+        if seed is not None and (not isinstance(seed, int)
+                                 or isinstance(seed, bool)):
+            msg = (f"Seed '{seed}' is not an int or None! "
+                   f"No {self.__class__.__name__} instance created. "
+                   f"Valid example: 3.")
+            LOGGER.error(msg)
+            raise exceptions.InvalidSeedError(msg)
+
         # Validate or convert the passed user agent. If no user agent is
         # passed, a random one is generated.
         user_agent = self.__check_user_agent(
@@ -440,9 +898,9 @@ class Header:
         :rtype: str
         """
 
-        # Remove the protocol and path of the url.
-        protocol = url.split("://", maxsplit=1)[0] if "://" in url else "https"
-        return url.replace(f"{protocol}://", "").split("/")[0]
+        # Network location of the url without protocol and path. Urls
+        # without protocol have none, so we cut them at the first '/'.
+        return _split_url(url).netloc or url.split("/")[0]
 
     def __referer(
             self,
@@ -467,22 +925,16 @@ class Header:
         # TODO: Also use sub-paths of the url as referers:
         #   domain.com/category/car.html -> domain.com/category/
 
-        referer_json = self.__load_json("referer_templates.json")
-
         # Create a list and add the url without path as first referer.
-        referers = [f"{url.split('/')[0]}//{url.split('/')[2]}/"]
+        parts = _split_url(url)
+        referers = [f"{parts.scheme}://{parts.netloc}/"]
 
         # Use language to get the TLD from the referer json. Fallback to
         # 'com' if not found.
-        tld = "com"
-        for key in referer_json.keys():
-            if language.lower() == referer_json[key][0].lower():
-                tld = key
-                break
+        tld = _LANG_TLD.get(language.lower(), "com")
 
-        # Add the referers from the json file, but skip the first entry,
-        # as it is the language (e.g. 'en-US').
-        referers.extend(referer_json.get(tld, [])[1:])
+        # Add the common referers of the TLD.
+        referers.extend(_TLD_REFERERS.get(tld, ()))
 
         return referers
 
@@ -500,34 +952,10 @@ class Header:
         :rtype: str
         """
 
-        return "0" if url.startswith("http://") else "1"
+        return _UIR_HTTP if _split_url(url).scheme == "http" else _UIR_HTTPS
 
     @staticmethod
-    def __sec_ch_ua_chromium(
-            user_agent: sua.UserAgent,
-            ) -> str:
-        """
-        Extract the Chromium version from the user agent string.
-
-        :param user_agent: The user agent object.
-        :type user_agent: sua.UserAgent
-        :return: The Chromium version or the browser version as
-            fallback.
-        :rtype: str
-        """
-
-        version = re.search(r'Chrome/(\d+)\.\d+\.\d+\.\d+', user_agent.string)
-
-        # Fallback for Chrome on some iOS devices.
-        if not version:
-            version = re.search(r'CriOS/(\d+)\.\d+\.\d+\.\d+',
-                                user_agent.string
-                                )
-
-        return version.group(1) if version else user_agent.browser_version
-
     def __sec_ch_ua(
-            self,
             ua_obj: sua.UserAgent,
             ) -> (tuple[str, str, str] |
                   tuple[None, None, None]):
@@ -539,65 +967,16 @@ class Header:
         :type ua_obj: sua.UserAgent
         :return: A tuple with the Sec-Ch-Ua, Sec-Ch-Ua-Mobile and
             Sec-Ch-Ua-Platform or None for unsupported browsers and os.
-        :rtype: tuple[list[str], list[str], list[str]] |
-            tuple[None, None, None]
-        """
-
-        # IE, Firefox and Safari do not send Sec-Ch-Ua headers.
-        if ua_obj.browser in ["Safari", "Firefox", "IE"]:
-            return None, None, None
-
-        # Always the same for all browsers.
-        sec_ch_ua_mobile = f"?{int(ua_obj.mobile)}"
-        sec_ch_ua_platform = ua_obj.os
-
-        # For Chrome-based browsers we need to extract Chromium version.
-        ua_chromium_version = self.__sec_ch_ua_chromium(ua_obj)
-
-        # Browser specific sec-ch-ua string.
-        # Opera.
-        if ua_obj.browser == "Opera":
-            sec_ch_ua = (
-                    f'"Not_A Brand";v="8", '
-                    f'"Chromium";v="{ua_chromium_version}", '
-                    f'"Opera";v="{ua_obj.browser_version}"')
-
-        # Edge.
-        elif ua_obj.browser == "Edge":
-            sec_ch_ua = (
-                    f'"Not A(Brand";v="99", '
-                    f'"Microsoft Edge";v="{ua_obj.browser_version}", '
-                    f'"Chromium";v="{ua_chromium_version}"')
-
-        # Whale.
-        elif ua_obj.browser == "Whale":
-            sec_ch_ua = (
-                    f'"Whale";v="{ua_obj.browser_version}", '
-                    f'"Not-A.Brand";v="8", '
-                    f'"Chromium";v="{ua_chromium_version}"')
-
-        # QQ Browser.
-        elif ua_obj.browser == "QQ Browser":
-            sec_ch_ua = (
-                    f'"Not A;Brand";v="{ua_obj.browser_version}", '
-                    f'"Chromium";v="{ua_chromium_version}", '
-                    f'"QQ Browser";v="{ua_obj.browser_version}"')
-
-        # Samsung Browser.
-        elif ua_obj.browser == "Samsung Browser":
-            sec_ch_ua = (
-                    f'"Not?A_Brand";v="{ua_obj.browser_version}", '
-                    f'"Chromium";v="{ua_chromium_version}", '
-                    f'"Samsung Browser";v="{ua_obj.browser_version}"')
-
-        # Chrome, Chromium and fallback for others.
-        else:
-            sec_ch_ua = (
-                    f'"Not A(Brand";v="99", '
-                    f'"Chromium";v="{ua_chromium_version}", '
-                    f'"Google Chrome";v="{ua_obj.browser_version}"')
+        :rtype: tuple[str, str, str] | tuple[None, None, None]
+        """
 
-        return sec_ch_ua, sec_ch_ua_mobile, sec_ch_ua_platform
+        return _sec_ch_ua(
+                user_agent_string=ua_obj.string,
+                browser=ua_obj.browser,
+                browser_version=ua_obj.browser_version,
+                os=ua_obj.os,
+                mobile=ua_obj.mobile,
+                )
 
     def generate(
             self,
@@ -630,9 +1009,10 @@ class Header:
         :param mobile: If the request should look like it was made from
             a mobile device. Only used if no user agent is passed.
         :type mobile: bool
-        :param seed: Seed for random headers values (if multiple values
-            are available). If None, the first and most common value is
-            used (max=720).
+        :param seed: Seed for header values (if multiple values are
+            available). Selects the (seed+1)-th value combination,
+            ranked by the number of values deviating from the most
+            common ones. If None, the most common values are used.
         :type seed: int
         :param intra_site_nav: If the request is made from the same site
             (intra-site navigation). If True, the referer is the url
@@ -656,6 +1036,7 @@ class Header:
                     language=language,
                     user_agent=user_agent,
                     mobile=mobile,
+                    seed=seed,
                     )
         else:
             self.url = url
@@ -666,117 +1047,199 @@ class Header:
         # Headers:
         # Domain to scrape without protocol and path.
         self.host = self.__host(url=self.url)
-        self.connection = "keep-alive"
-        self.cache_control = "max-age=0"
+        self.connection = _CONNECTION
+        self.cache_control = _CACHE_CONTROL
         # Sec-Ch-Ua headers only send by Chrome-based browsers.
-        self.sec_ch_ua = self.__sec_ch_ua(ua_obj=self.user_agent)[0]
-        self.sec_ch_ua_mobile = self.__sec_ch_ua(ua_obj=self.user_agent)[1]
-        self.sec_ch_ua_platform = self.__sec_ch_ua(ua_obj=self.user_agent)[2]
+        (self.sec_ch_ua,
+         self.sec_ch_ua_mobile,
+         self.sec_ch_ua_platform) = self.__sec_ch_ua(ua_obj=self.user_agent)
         # SSL connection: '1', no SSL: '0'.
         self.upgrade_insecure_requests = self.__upgrade_insecure_requests(
                 url=self.url
                 )
-        # Direct request: 'none', dynamic data request (XHR): 'none'.
-        self.sec_fetch_site = ["none", "same-site"]
-        # Direct request: 'navigate', XHR: 'cors' or 'same-origin'.
-        self.sec_fetch_mode = ["navigate", "same-origin", "cors"]
-        # Direct html request: 'document', XHR: 'empty'.
-        self.sec_fetch_dest = ["document", "empty"]
-        # Request made by user ('?1') or by script (omitted).
-        self.sec_fetch_user = "?1"
+        self.sec_fetch_site = _SEC_FETCH_SITE
+        self.sec_fetch_mode = _SEC_FETCH_MODE
+        self.sec_fetch_dest = _SEC_FETCH_DEST
+        self.sec_fetch_user = _SEC_FETCH_USER
         # Host url and language specific referer.
         self.referer = self.__referer(
                 url=self.url,
                 language=self.language,
                 )
-        # Sometimes 'br' is used to identify a scraper.
-        self.accept_encoding = ["gzip, deflate", "gzip, deflate, br"]
+        self.accept_encoding = _ACCEPT_ENCODING
         # Language of website or where the request is made from.
-        self.accept_language = [
-                f"{self.language},{self.language[:2]};q=0.5",
-                f"{self.language},{self.language[:2]};q=0.9"]
+        self.accept_language = (_ACCEPT_LANGUAGE.get(self.language)
+                                or _accept_languages(self.language))
 
-        # Import header templates json and get the template for the current os
-        # and browser.
-        header_templates = self.__load_json("header_templates.json")
+        # Combine the header values into the ordered dictionary.
+        self.dict = self.__build_dict(
+                seed=seed,
+                intra_site_nav=intra_site_nav,
+                )
 
-        # Fallback for other browser and os.
-        if self.user_agent.os == "Other" or self.user_agent.browser == "Other":
-            fallback_os = self.user_agent.os
-            fallback_browser = self.user_agent.browser
-            if self.user_agent.os == "Other":
-                fallback_os = "Windows"
+        return self.dict
 
-            if self.user_agent.browser == "Other":
-                fallback_browser = "Chrome"
+    def _reseed(
+            self,
+            seed: int | None,
+            intra_site_nav: bool = False,
+            ) -> dict[str, str]:
+        """
+        Regenerate only the header dictionary for another seed. All
+        other header values of the instance are reused, so generate()
+        must have been called before. Used by get_list to derive the
+        instances of all seeds from a single generated instance.
+
+        :param seed: Seed for header values (if multiple values are
+            available). Selects the (seed+1)-th value combination,
+            ranked by the number of values deviating from the most
+            common ones. If None, the most common values are used.
+        :type seed: int | None
+        :param intra_site_nav: If the request is made from the same site
+            (intra-site navigation). If True, the referer is the url
+            without path. If False, the referer is a random referer from
+            the same TLD (default=False).
+        :type intra_site_nav: bool
+        :return: The headers as a dictionary.
+        :rtype: dict[str, str]
+        """
 
-            header_template = header_templates[fallback_os][
-                fallback_browser]
+        # Copies of an instance share its referer list, every instance
+        # gets its own one (as the header dictionary).
+        self.referer = list(self.referer)
+        self.seed = seed
+        self.dict = self.__build_dict(
+                seed=seed,
+                intra_site_nav=intra_site_nav,
+                )
 
-        else:
-            try:
-                header_template = header_templates[self.user_agent.os][
-                    self.user_agent.browser]
-            except KeyError:
-                LOGGER.warning(
-                        f"Could not find header template for "
-                        f"'{self.user_agent.os}' and "
-                        f"'{self.user_agent.browser}'! Falling back to "
-                        f"a good default header template."
-                        )
-                if self.mobile:
-                    header_template = header_templates["Android"]["Chrome"]
-                else:
-                    header_template = header_templates["Windows"]["Chrome"]
+        return self.dict
+
+    def __build_dict(
+            self,
+            seed: int | None,
+            intra_site_nav: bool,
+            ) -> dict[str, str]:
+        """
+        Combine the header values of the instance into a dictionary in
+        the order of the header template for its os and browser. The
+        seed selects the variant of the multi-valued headers.
+
+        :param seed: Seed for the header value combination.
+        :type seed: int | None
+        :param intra_site_nav: If the referer is the url without path.
+        :type intra_site_nav: bool
+        :return: The headers as a dictionary.
+        :rtype: dict[str, str]
+        """
+
+        # Get the template plan for the current os and browser. Fallback
+        # for other browser and os.
+        template_os = self.user_agent.os
+        if template_os == "Other":
+            template_os = "Windows"
+
+        template_browser = self.user_agent.browser
+        if template_browser == "Other":
+            template_browser = "Chrome"
 
-        # Assign the instance attributes values to the header template.
-        for key in header_template:
+        plan = _TEMPLATE_PLANS.get((template_os, template_browser))
+        if plan is None:
+            LOGGER.warning(
+                    f"Could not find header template for "
+                    f"'{self.user_agent.os}' and "
+                    f"'{self.user_agent.browser}'! Falling back to "
+                    f"a good default header template."
+                    )
+            plan = _TEMPLATE_PLANS[(_FALLBACK_OS[bool(self.mobile)],
+                                    "Chrome")]
+        keys, steps = plan
+
+        # Variant index of every multi-valued attribute for this seed,
+        # larger seeds wrap around.
+        indices = dict(zip(_SEED_ATTRS,
+                           _COMBINATIONS[(seed or 0) % _NUM_COMBINATIONS]))
+
+        # Collect the header values in the order of the template keys.
+        # The template is only read, so the ordering is preserved by
+        # zipping the keys with the values into the final dict at once.
+        values = []
+        for action, arg in steps:
+
+            # The attribute is a single value.
+            if action == _FROM_ATTR:
+                values.append(getattr(self, arg))
+
+            # The attribute is a tuple: pick the variant of the ranked
+            # combination selected by the seed.
+            elif action == _FROM_VARIANTS:
+                values.append(getattr(self, arg)[indices[arg]])
 
             # The Accept header is defined in the template, we just need
             # to assign it to the instance attribute.
-            if key == "Accept":
-                self.accept = header_template[key]
-                continue
+            elif action == _FROM_TEMPLATE:
+                self.accept = arg
+                values.append(arg)
 
             # For the user agent header we use the user agent string
             # from the user agent object.
-            elif key == "User-Agent":
-                header_template[key] = self.user_agent.string
-                continue
+            elif action == _FROM_USER_AGENT:
+                values.append(self.user_agent.string)
 
-            elif key == "Referer":
-                if intra_site_nav:
-                    header_template[key] = self.referer[0]
-                else:
-                    header_template[key] = random.SystemRandom().choice(
-                            self.referer[1:]
-                            )
-                continue
+            # The referer is the url without path for intra-site
+            # navigation, else a random referer.
+            elif intra_site_nav:
+                values.append(self.referer[0])
 
-            # We convert it to the right formatted name of the instance
-            # attribute.
             else:
-                attr = getattr(self, key.lower().replace("-", "_"))
+                values.append(_SYSTEM_RANDOM.choice(self.referer[1:]))
 
-            # The attribute is a list.
-            if isinstance(attr, list):
-                # Random element.
-                if seed is not None:
-                    random.seed(seed)
-                    header_template[key] = random.choice(attr)
-                    random.seed()
+        return dict(zip(keys, values))
 
-                else:
-                    # First element.
-                    header_template[key] = attr[0]
 
-            # The attribute is a string.
-            else:
-                header_template[key] = attr
+@functools.lru_cache(maxsize=4096)
+def _cached_dict(
+        url: str,
+        language: str | None,
+        user_agent: str,
+        mobile: bool,
+        seed: int | None,
+        ) -> tuple[types.MappingProxyType[str, str], tuple[str, ...]]:
+    """
+    Generate the header dictionary for a given user agent string and
+    cache it together with the common referers of the TLD. Only the
+    referer can differ between calls with the same parameters (random
+    referer without intra-site navigation), so repeated calls skip the
+    header generation and only swap the referer. The cached dictionary
+    is shared between calls, so it is wrapped in a read-only proxy.
+    Callers return a copy of it.
+
+    :param url: The url to scrape.
+    :type url: str
+    :param language: The language code or None to auto-detect it.
+    :type language: str | None
+    :param user_agent: The user agent string.
+    :type user_agent: str
+    :param mobile: If the request should look like it was made from
+        a mobile device.
+    :type mobile: bool
+    :param seed: Seed for the header value combination.
+    :type seed: int | None
+    :return: The cached intra-site navigation headers as a read-only
+        mapping and the common referers to pick a random one from.
+    :rtype: tuple[types.MappingProxyType[str, str], tuple[str, ...]]
+    """
 
-        self.dict = header_template
+    header = Header(
+            url=url,
+            language=language,
+            user_agent=user_agent,
+            mobile=mobile,
+            seed=seed,
+            intra_site_nav=True,
+            )
 
-        return header_template
+    return types.MappingProxyType(header.dict), tuple(header.referer[1:])
 
 
 class Headers:
@@ -792,6 +1255,21 @@ class Headers:
         """
         pass
 
+    @staticmethod
+    def cache_clear() -> None:
+        """
+        Clear the caches of generated header dictionaries, parsed user
+        agents, split urls and Sec-Ch-Ua headers, e.g. to free memory
+        after a long scraping session or to isolate tests. The template
+        lookup tables built at import are kept.
+        """
+
+        for cached_func in (_cached_dict,
+                            _parse_user_agent,
+                            _split_url,
+                            _sec_ch_ua):
+            cached_func.cache_clear()
+
     @staticmethod
     def get_dict(
             url: str,
@@ -822,9 +1300,10 @@ class Headers:
         :param mobile: If the request should look like it was made from
             a mobile device.
         :type mobile: bool
-        :param seed: Seed for random headers values (if multiple values
-            are available). If None, the first and most common value is
-            used (max=720).
+        :param seed: Seed for header values (if multiple values are
+            available). Selects the (seed+1)-th value combination,
+            ranked by the number of values deviating from the most
+            common ones. If None, the most common values are used.
         :type seed: int
         :param intra_site_nav: If the request is made from the same site
         (intra-site navigation). If True, the referer is the url
@@ -835,6 +1314,30 @@ class Headers:
         :rtype: dict[str, str]
         """
 
+        # With a user agent string, the headers are always the same for
+        # the same parameters except the referer, so we can use the
+        # cache and only pick a random referer if needed. UserAgent
+        # objects are used as is, their attributes may differ from the
+        # parsed string. Other types of url and language are left to
+        # the validation of Header.
+        if (isinstance(user_agent, str)
+                and isinstance(url, str)
+                and isinstance(language, (str, type(None)))
+                and isinstance(seed, (int, type(None)))):
+            cached, referers = _cached_dict(
+                    url=url,
+                    language=language,
+                    user_agent=user_agent,
+                    mobile=mobile,
+                    seed=seed,
+                    )
+            headers = dict(cached)
+
+            if not intra_site_nav and "Referer" in headers:
+                headers["Referer"] = _SYSTEM_RANDOM.choice(referers)
+
+            return headers
+
         # Create a Header instance.
         header = Header(
                 url=url,
@@ -860,10 +1363,12 @@ class Headers:
         """
         Generate headers for a request with right orderings and values
         to avoid anti-scraping techniques applied by websites. In the
-        returned list, are Header instances with different seeds for
-        all possible header value combinations. The instances are
-        ordered by their plausibility of being accepted as legitimate
-        browser by the server.
+        returned list, are Header instances with the same user agent and
+        different seeds for all possible header value combinations. If
+        no user agent is passed, one random user agent is generated and
+        used for all instances. The instances are ordered by the number
+        of header values deviating from the most common ones, starting
+        with the most common values.
 
         :param url: The url to scrape.
         :type url: str
@@ -882,7 +1387,9 @@ class Headers:
             a mobile device.
         :type mobile: bool
         :param num: Number of header instances to generate and append to
-            the list (max=720, default=10).
+            the list (default=10). After all 48 header value
+            combinations, the seeds wrap around to the most common
+            values again.
         :type num: int
         :param intra_site_nav: If the request is made from the same site
         (intra-site navigation). If True, the referer is the url
@@ -893,21 +1400,116 @@ class Headers:
         :rtype: dict[str, str]
         """
 
+        # More instances than header value combinations: the seeds wrap
+        # around, so the header values repeat.
+        if num > _NUM_COMBINATIONS:
+            LOGGER.warning(
+                    f"Only {_NUM_COMBINATIONS} different header value "
+                    f"combinations available, but {num} requested! "
+                    f"Header values repeat after the {_NUM_COMBINATIONS}th "
+                    f"instance."
+                    )
+
         headers = []
 
-        for i in range(min(num, 720)):
+        for i in range(num):
+            # The first instance validates the inputs and resolves the
+            # user agent and language once.
+            if not headers:
+                header = Header(
+                        url=url,
+                        language=language,
+                        user_agent=user_agent,
+                        mobile=mobile,
+                        seed=i,
+                        intra_site_nav=intra_site_nav,
+                        )
+
+            # All following instances are copies of the first one, where
+            # only the header dictionary for the next seed is generated.
+            else:
+                header = copy.copy(headers[0])
+                header._reseed(seed=i, intra_site_nav=intra_site_nav)
+
+            headers.append(header)
+
+        return headers
+
+    @staticmethod
+    def get_dicts(
+            urls: Iterable[str],
+            language: str = None,
+            user_agent: str | sua.UserAgent = None,
+            mobile: bool = False,
+            seed: int = None,
+            intra_site_nav: bool = False,
+            ) -> list[dict[str, str]]:
+        """
+        Generate headers for requests to multiple urls at once. All
+        returned dictionaries share the same user agent, so they look
+        like one browser visiting the urls. If no user agent is passed,
+        one random user agent is generated and used for all urls.
+
+        :param urls: The urls to scrape.
+        :type urls: Iterable[str]
+        :param language: Language of the websites or where the requests
+            are made from. If None, automatically detected from the TLD
+            of every url. Overwrite it by passing the ISO language code
+            (e.g.'en-US','en-AU', 'de-DE', ...).
+        :type language: str
+        :param user_agent: The user agent to use for the requests. If
+            None, a random user agent is generated. If a string is
+            passed, it is parsed to a UserAgent object. If a UserAgent
+            object is passed, it is used as is.
+        :type user_agent: str | sua.UserAgent
+        :param mobile: If the requests should look like they were made
+            from a mobile device.
+        :type mobile: bool
+        :param seed: Seed for header values (if multiple values are
+            available). Selects the (seed+1)-th value combination,
+            ranked by the number of values deviating from the most
+            common ones. If None, the most common values are used.
+        :type seed: int
+        :param intra_site_nav: If the requests are made from the same
+        site (intra-site navigation). If True, the referer is the url
+        without path. If False, the referer is a random referer from
+        the same TLD (default=False).
+        :type intra_site_nav: bool
+        :return: The headers of every url in a dictionary, in the order
+            of the passed urls.
+        :rtype: list[dict[str, str]]
+        """
+
+        dicts = []
+
+        for url in urls:
+            # User agent given (or resolved by the first url): reuse the
+            # single url function (and its cache for strings).
+            if isinstance(user_agent, (str, sua.UserAgent)):
+                dicts.append(Headers.get_dict(
+                        url=url,
+                        language=language,
+                        user_agent=user_agent,
+                        mobile=mobile,
+                        seed=seed,
+                        intra_site_nav=intra_site_nav,
+                        ))
+                continue
+
+            # No valid user agent passed: the first header generates a
+            # random one, which is shared by all following headers.
             header = Header(
                     url=url,
                     language=language,
                     user_agent=user_agent,
                     mobile=mobile,
-                    seed=i,
+                    seed=seed,
                     intra_site_nav=intra_site_nav,
                     )
+            user_agent = header.user_agent
+            dicts.append(header.dict)
 
-            headers.append(header)
-
-        return headers
+        return dicts
 
     @staticmethod
     def get(
@@ -921,11 +1523,10 @@ class Headers:
         """
         Generate headers for a request with right orderings and values
         to avoid anti-scraping techniques applied by websites. It
-        returns a single Header instance with the most plausibility to be
-        accepted as legitimate browser by the server. With its
-        attributes you can access each header value separately and get
-        the ready to use header dictionary by its dict attribute or
-        __dict__ method.
+        returns a single Header instance, with the most common header
+        values if no seed is passed. With its attributes you can access
+        each header value separately and get the ready to use header
+        dictionary by its dict attribute or as_dict method.
 
         :param url: The url to scrape.
         :type url: str
@@ -943,9 +1544,10 @@ class Headers:
         :param mobile: If the request should look like it was made from
             a mobile device.
         :type mobile: bool
-        :param seed: Seed for random headers values (if multiple values
-            are available). If None, the first and most common value is
-            used (max=720).
+        :param seed: Seed for header values (if multiple values are
+            available). Selects the (seed+1)-th value combination,
+            ranked by the number of values deviating from the most
+            common ones. If None, the most common values are used.
         :type seed: int
         :param intra_site_nav: If the request is made from the same site
             (intra-site navigation). If True, the referer is the url
@@ -971,4 +1573,5 @@ class Headers:
 # Convenience functions.
 get_dict = Headers.get_dict
 get_list = Headers.get_list
+get_dicts = Headers.get_dicts
 get = Headers.get
@@ -32,6 +32,13 @@ class InvalidURLError(SimpleHeaderException):
     """
 
 
+class InvalidSeedError(SimpleHeaderException):
+    """
+    Raise an exception for invalid seeds passed to the Header instance
+    while initialization.
+    """
+
+
 class TemplateNotFoundError(SimpleHeaderException):
     """
     Raise an exception for missing templates in the data folder.
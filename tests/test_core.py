@@ -24,6 +24,9 @@ __status__ = "Development"
 __github__ = "https://github.com/Lennolium/simple-header"
 
 # Imports.
+import contextlib
+import copy
+import functools
 import importlib
 import io
 import json
@@ -34,48 +37,148 @@ from unittest.mock import patch
 
 import simple_header
 
+# User agents used throughout the tests, parsed once at import.
+UA_CHROME_MAC_STRING = (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/110.0.0.0 Safari/537.36")
+UA_CHROME_MAC = simple_header.sua.parse(UA_CHROME_MAC_STRING)
+UA_CHROME_WIN = simple_header.sua.parse(
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/58.0.3029.110 Safari/537.3")
+UA_CHROME_WIN_60 = simple_header.sua.parse(
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/60.0.3112.113 Safari/537.3")
+UA_NO_CHROMIUM = simple_header.sua.parse(
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Safari/537.3")
+UA_CHROME_ANDROID = simple_header.sua.parse(
+        "Mozilla/5.0 (Linux; Android 10; K) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Mobile Safari/537.36")
+UA_FIREFOX = simple_header.sua.parse(
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:60.0) "
+        "Gecko/20100101 Firefox/60.0")
+UA_SAFARI = simple_header.sua.parse(
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_13_6) "
+        "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/11.1.2 "
+        "Safari/605.1.15")
+UA_EDGE = simple_header.sua.parse(
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 "
+        "Safari/537.3 Edge/16.16299")
+UA_WHALE = simple_header.sua.parse(
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 "
+        "Whale/3.24.223.21 Safari/537.36")
+UA_OPERA = simple_header.sua.parse(
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 "
+        "Safari/537.36 OPR/106.0.0.0")
+UA_QQ = simple_header.sua.parse(
+        "Mozilla/5.0 (Windows NT 10.0; WOW64) AppleWebKit/537.36 ("
+        "KHTML, like Gecko) Chrome/94.0.4606.71 Safari/537.36 "
+        "Core/1.94.192.400 QQBrowser/11.5.5250.400")
+
+
+# Scenarios for the Headers tests: name, parameters and the language
+# expected in the Accept-Language header.
+HEADERS_SCENARIOS = (
+        # Test with all parameters provided
+        ("all_params",
+         dict(url="https://www.example.com", language="en-US",
+              user_agent=UA_CHROME_MAC, mobile=False, seed=1,
+              intra_site_nav=True),
+         "en-US"),
+        # Test with no user_agent provided
+        ("no_user_agent",
+         dict(url="https://www.example.com", language="en-US",
+              user_agent=None, mobile=False, seed=1, intra_site_nav=True),
+         "en-US"),
+        # Test with no language provided (test auto-detect).
+        ("no_language",
+         dict(url="https://www.example.com.au", language=None,
+              user_agent=UA_CHROME_MAC_STRING, mobile=False, seed=1,
+              intra_site_nav=True),
+         "en-AU"),
+        # Test with mobile set to True
+        ("mobile",
+         dict(url="https://www.example.com", language="en-US",
+              user_agent=UA_CHROME_ANDROID, mobile=True, seed=1,
+              intra_site_nav=True),
+         "en-US"),
+        # Test with intra_site_nav set to False
+        ("random_referer",
+         dict(url="https://www.example.com", language="en-US",
+              user_agent=UA_CHROME_MAC_STRING, mobile=False, seed=1,
+              intra_site_nav=False),
+         "en-US"),
+        # Test with intra_site_nav set to True, referer should be the
+        # same as the url.
+        ("intra_site_nav",
+         dict(url="https://www.example.com", language="en-US",
+              user_agent=UA_CHROME_MAC_STRING, mobile=False, seed=1,
+              intra_site_nav=True),
+         "en-US"),
+        )
+
 
 class TestHeader(unittest.TestCase):
-    def setUp(self):
-        self.url = "https://www.example.com"
-        self.language = "en-US"
-        self.mobile = False
-        self.seed = 1
-        self.intra_site_nav = True  # For always same referer.
-        self.user_agent_string = (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/110.0.0.0 Safari/537.36")
-        self.user_agent = simple_header.sua.parse(self.user_agent_string)
-
-        self.header = simple_header.Header(
-                url=self.url,
-                language=self.language,
-                user_agent=self.user_agent,
-                mobile=self.mobile,
-                seed=self.seed,
-                intra_site_nav=self.intra_site_nav
+    @classmethod
+    def setUpClass(cls):
+        # The reference Header is shared by all tests and only read.
+        # Tests that call generate() on it work on a copy.
+        cls.url = "https://www.example.com"
+        cls.language = "en-US"
+        cls.mobile = False
+        cls.seed = 1
+        cls.intra_site_nav = True  # For always same referer.
+        cls.user_agent_string = UA_CHROME_MAC_STRING
+        cls.user_agent = UA_CHROME_MAC
+
+        cls.header = simple_header.Header(
+                url=cls.url,
+                language=cls.language,
+                user_agent=cls.user_agent,
+                mobile=cls.mobile,
+                seed=cls.seed,
+                intra_site_nav=cls.intra_site_nav
                 )
 
         # Resulting header fields.
-        self.host = 'www.example.com'
-        self.connection = 'keep-alive'
-        self.cache_control = 'max-age=0'
-        self.sec_ch_ua = ('"Not A(Brand";v="99", "Chromium";v="110", "Google '
-                          'Chrome";v="110"')
-        self.sec_ch_ua_mobile = "?0"
-        self.sec_ch_ua_platform = "macOS"
-        self.upgrade_insecure_requests = "1"
-        self.accept = (
-                "text/html,application/xhtml+xml,application/xml;q=0.9,"
-                "image/avif,image/webp,image/apng,*/*;q=0.8,"
-                "application/signed-exchange;v=b3;q=0.7")
-        self.sec_fetch_site = "none"
-        self.sec_fetch_mode = "navigate"
-        self.sec_fetch_user = "?1"
-        self.sec_fetch_dest = "document"
-        self.accept_encoding = "gzip, deflate"
-        self.accept_language = "en-US,en;q=0.5"
+        cls.expected_dict = {
+                "Host": "www.example.com",
+                "Connection": "keep-alive",
+                "Cache-Control": "max-age=0",
+                "Sec-Ch-Ua": '"Not A(Brand";v="99", "Chromium";v="110", '
+                             '"Google Chrome";v="110"',
+                "Sec-Ch-Ua-Mobile": "?0",
+                "Sec-Ch-Ua-Platform": "macOS",
+                "Upgrade-Insecure-Requests": "1",
+                "User-Agent": cls.user_agent_string,
+                "Accept": "text/html,application/xhtml+xml,application/xml;"
+                          "q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,"
+                          "application/signed-exchange;v=b3;q=0.7",
+                "Sec-Fetch-Site": "none",
+                "Sec-Fetch-Mode": "navigate",
+                "Sec-Fetch-User": "?1",
+                "Sec-Fetch-Dest": "document",
+                "Accept-Encoding": "gzip, deflate",
+                "Accept-Language": "en-US,en;q=0.9",
+                }
+
+    def setUp(self):
+        # Bind the private methods under test once.
+        self.check_language = self.header._Header__check_language
+        self.check_user_agent = self.header._Header__check_user_agent
+        self.detect_language = self.header._Header__detect_language
+        self.host = self.header._Header__host
+        self.referer = self.header._Header__referer
+        self.sec_ch_ua = self.header._Header__sec_ch_ua
+        self.upgrade_insecure_requests = (
+                self.header._Header__upgrade_insecure_requests)
 
     def test_init(self):
         self.assertEqual(self.header.url, self.url)
@@ -91,7 +194,7 @@ class TestHeader(unittest.TestCase):
     def test_init_calls_validations(self, mock_validations):
         mock_validations.return_value = (
                 self.url, self.language, self.user_agent, self.mobile)
-        header = simple_header.Header(
+        simple_header.Header(
                 url=self.url,
                 language=self.language,
                 user_agent=self.user_agent,
@@ -103,11 +206,26 @@ class TestHeader(unittest.TestCase):
                 url=self.url,
                 language=self.language,
                 user_agent=self.user_agent,
-                mobile=self.mobile
+                mobile=self.mobile,
+                seed=self.seed
                 )
 
-    @patch('simple_header.core.LOGGER')
-    def test_validations_invalid_url(self, mock_logger):
+    def test_validations_invalid_seed(self):
+        # Test seeds that can not select a header value combination, on
+        # both the direct and the cached path.
+        for seed in ("abc", 1.5, True, [1]):
+            for func in (simple_header.get, simple_header.get_dict):
+                with self.subTest(seed=seed, func=func.__name__):
+                    with self.assertLogs('simple_header.core',
+                                         level='ERROR'):
+                        with self.assertRaises(
+                                simple_header.exceptions.InvalidSeedError):
+                            func(url=self.url,
+                                 user_agent=UA_CHROME_MAC_STRING,
+                                 seed=seed
+                                 )
+
+    def test_validations_invalid_url(self):
         # Create a Header instance
         header = simple_header.Header(
                 url="https://www.example.com",
@@ -122,64 +240,92 @@ class TestHeader(unittest.TestCase):
 
         # Test with invalid URL
         invalid_url = "NotaValidUrl com"
-        with self.assertRaises(simple_header.exceptions.InvalidURLError):
-            header._Header__validations(
-                    url=invalid_url,
-                    language="en-US",
-                    user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X "
-                               "10_15_7) AppleWebKit/537.36 (KHTML, "
-                               "like Gecko) Chrome/110.0.0.0 Safari/537.36",
-                    mobile=False,
-                    )
+        with self.assertLogs('simple_header.core', level='ERROR') as cm:
+            with self.assertRaises(simple_header.exceptions.InvalidURLError):
+                header._Header__validations(
+                        url=invalid_url,
+                        language="en-US",
+                        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X "
+                                   "10_15_7) AppleWebKit/537.36 (KHTML, "
+                                   "like Gecko) Chrome/110.0.0.0 "
+                                   "Safari/537.36",
+                        mobile=False,
+                        )
 
         # Check if the logger error has been called
-        mock_logger.error.assert_called_once()
+        self.assertEqual(len(cm.records), 1)
+
+        # Test an url only rejected by the validators package (invalid
+        # characters in the path), not matched by the fast regex.
+        with self.assertLogs('simple_header.core', level='ERROR'):
+            with self.assertRaises(simple_header.exceptions.InvalidURLError):
+                header._Header__validations(
+                        url="https://www.example.com/<script>",
+                        language="en-US",
+                        user_agent=header.user_agent,
+                        mobile=False,
+                        )
 
-    def test_dict(self):
-        header = simple_header.Header(
-                url=self.url,
-                language=self.language,
-                user_agent=self.user_agent,
-                mobile=self.mobile,
-                seed=self.seed,
-                intra_site_nav=self.intra_site_nav,
+        # Test urls the validators package rejects, which the fast regex
+        # must not accept either (port 0, query without value, invalid
+        # fragment characters).
+        cases = (
+                "https://example.com/?a",
+                "https://example.com:0",
+                "https://example.com?q=x&y",
+                "https://example.com/#Qé",
+                )
+        for url in cases:
+            with self.subTest(url=url):
+                with self.assertLogs('simple_header.core', level='ERROR'):
+                    with self.assertRaises(
+                            simple_header.exceptions.InvalidURLError):
+                        header._Header__validations(
+                                url=url,
+                                language="en-US",
+                                user_agent=header.user_agent,
+                                mobile=False,
+                                )
+
+        # Test urls with query, fragment and port accepted by both.
+        cases = (
+                "https://example.com/?a=1&b=2",
+                "https://example.com:65535/path",
+                "https://example.com/path#fragment",
                 )
+        for url in cases:
+            with self.subTest(url=url):
+                result = header._Header__validations(
+                        url=url,
+                        language="en-US",
+                        user_agent=header.user_agent,
+                        mobile=False,
+                        )
+                self.assertEqual(result[0], url)
 
-        header_dict = self.header.__dict__()
-        self.assertIsInstance(header_dict, dict)
-        self.assertEqual(header_dict['Host'], self.host)
-        self.assertEqual(header_dict['Connection'], self.connection)
-        self.assertEqual(header_dict['Cache-Control'], self.cache_control)
-        self.assertEqual(header_dict['Sec-Ch-Ua'], self.sec_ch_ua)
-        self.assertEqual(header_dict['Sec-Ch-Ua-Mobile'],
-                         self.sec_ch_ua_mobile
-                         )
-        self.assertEqual(header_dict['Sec-Ch-Ua-Platform'],
-                         self.sec_ch_ua_platform
-                         )
-        self.assertEqual(header_dict['Upgrade-Insecure-Requests'],
-                         self.upgrade_insecure_requests
-                         )
-        self.assertEqual(header_dict['User-Agent'], self.user_agent_string)
-        self.assertEqual(header_dict['Accept'], self.accept)
-        self.assertEqual(header_dict['Sec-Fetch-Site'], self.sec_fetch_site)
-        self.assertEqual(header_dict['Sec-Fetch-Mode'], self.sec_fetch_mode)
-        self.assertEqual(header_dict['Sec-Fetch-User'], self.sec_fetch_user)
-        self.assertEqual(header_dict['Sec-Fetch-Dest'], self.sec_fetch_dest)
-        self.assertEqual(header_dict['Accept-Encoding'],
-                         self.accept_encoding
-                         )
-        self.assertEqual(header_dict['Accept-Language'],
-                         self.accept_language
+        # Test an url only accepted by the validators package (ip).
+        result = header._Header__validations(
+                url="https://127.0.0.1/index.html",
+                language="en-US",
+                user_agent=header.user_agent,
+                mobile=False,
+                )
+        self.assertEqual(result[0], "https://127.0.0.1/index.html")
+
+    def test_dict(self):
+        header_dict = self.header.as_dict()
+        self.assertIs(type(header_dict), dict)
+        self.assertEqual({key: header_dict[key] for key in self.expected_dict},
+                         self.expected_dict
                          )
 
     def test_str(self):
         header_str = str(self.header)
-        self.assertIsInstance(header_str, str)
+        self.assertIs(type(header_str), str)
 
     def test_repr(self):
         header_repr = repr(self.header)
-        self.assertIsInstance(header_repr, str)
+        self.assertIs(type(header_repr), str)
         expected_repr = (f"Header(url={self.url!r}, language="
                          f"{self.language!r}, user_agent="
                          f"{self.user_agent.string!r}, "
@@ -205,11 +351,7 @@ class TestHeader(unittest.TestCase):
         header_diff = simple_header.Header(
                 url="https://www.different.com",
                 language="fr-FR",
-                user_agent=simple_header.sua.parse(
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/58.0.3029.110 Safari/537.3"
-                        ),
+                user_agent=UA_CHROME_WIN,
                 mobile=True,
                 seed=2,
                 intra_site_nav=True
@@ -228,7 +370,9 @@ class TestHeader(unittest.TestCase):
         self.assertEqual(self.header['seed'], self.seed)
         self.assertEqual(self.header['intra_site_nav'], self.intra_site_nav)
 
-        self.assertEqual(self.header['Sec-ch-UA'], self.sec_ch_ua)
+        self.assertEqual(self.header['Sec-ch-UA'],
+                         self.expected_dict['Sec-Ch-Ua']
+                         )
 
         with self.assertRaises(AttributeError):
             self.header['non_existing_attribute']
@@ -240,130 +384,170 @@ class TestHeader(unittest.TestCase):
         with self.assertRaises(AttributeError):
             self.header['uRl#*']
 
-    @patch('simple_header.core.Header._Header__load_json')
-    def test_load_json(self, mock_load_json):
-        # Test loading an existing JSON file
-        mock_load_json.return_value = {"key": "value"}
-        result = self.header._Header__load_json("existing_file.json")
-        self.assertEqual(result, {"key": "value"})
-
-        # Test loading a non-existing JSON file
-        mock_load_json.side_effect = FileNotFoundError()
-        with self.assertRaises(FileNotFoundError):
-            self.header._Header__load_json("non_existing_file.json")
-
-        # Test loading a file with invalid JSON
-        mock_load_json.side_effect = json.JSONDecodeError('Invalid JSON',
-                                                          doc='', pos=0
-                                                          )
-        with self.assertRaises(json.JSONDecodeError):
-            self.header._Header__load_json("invalid_json_file.json")
-
-        # Test loading a JSON file that does not exist in the templates
-        mock_load_json.side_effect = (
-                simple_header.exceptions.TemplateNotFoundError())
-        with self.assertRaises(simple_header.exceptions.TemplateNotFoundError):
-            self.header._Header__load_json("non_existing_template.json")
-
-    @patch('simple_header.core.LOGGER')
-    def test_load_json_exception(self, mock_logger):
-        with self.assertRaises(simple_header.exceptions.TemplateNotFoundError):
-            # Load a non-existent JSON file.
-            self.header._Header__load_json('non_existent_file.json')
-
-        mock_logger.error.assert_called_once()
-
-    @patch('simple_header.core.Header._Header__load_json')
-    def test_detect_language(self, mock_load_json):
-        # Mock the __load_json method to return a specific referer json
-        mock_load_json.return_value = {"com": ["en-US"], "de": ["de-DE"]}
-
-        # Test detecting language from a URL with a .com TLD
-        result = self.header._Header__detect_language(
-                "https://www.example.com"
+    def test_load_json(self):
+        load_json = simple_header.core._load_json
+
+        # Test loading an existing JSON file, parsed once and read-only
+        result = load_json("referer_templates.json")
+        self.assertEqual(result["com"][0], "en-US")
+        self.assertIs(load_json("referer_templates.json"), result)
+        with self.assertRaises(TypeError):
+            result["key"] = "value"
+        # Nested values are read-only as well
+        self.assertIsInstance(result["com"], tuple)
+        template = load_json("header_templates.json")["Windows"]["Chrome"]
+        with self.assertRaises(TypeError):
+            template["Host"] = "value"
+
+        # Test loading a file with invalid JSON, bypassing the cache
+        with patch('simple_header.core.json.load',
+                   side_effect=json.JSONDecodeError('Invalid JSON',
+                                                    doc='', pos=0
+                                                    )
+                   ):
+            with self.assertLogs('simple_header.core', level='ERROR'):
+                with self.assertRaises(
+                        simple_header.exceptions.TemplateNotFoundError):
+                    load_json.__wrapped__("referer_templates.json")
+
+    def test_load_json_exception(self):
+        with self.assertLogs('simple_header.core', level='ERROR') as cm:
+            with self.assertRaises(
+                    simple_header.exceptions.TemplateNotFoundError):
+                # Load a non-existent JSON file.
+                simple_header.core._load_json('non_existent_file.json')
+
+        self.assertEqual(len(cm.records), 1)
+
+    @patch.dict('simple_header.core._TLD_LANG',
+                {"com": "en-US", "de": "de-DE", "com.au": "en-AU"},
+                clear=True
                 )
-        self.assertEqual(result, "en-US")
-
-        # Test detecting language from a URL with a .de TLD
-        result = self.header._Header__detect_language(
-                "https://www.example.de"
+    def test_detect_language(self):
+        cases = (
+                # Test detecting language from a URL with a .com TLD
+                ("https://www.example.com", "en-US"),
+                # Test detecting language from a URL with a .de TLD
+                ("https://www.example.de", "de-DE"),
+                # Test detecting language from a URL with a TLD that is
+                # not in the referer json, should fallback to 'en-US'
+                ("https://www.example.fr", "en-US"),
+                # Test detecting language from a URL with a multi-label TLD
+                ("https://www.example.com.au/path", "en-AU"),
+                # Test detecting language from a bare TLD as hostname
+                ("https://com.au", "en-AU"),
+                ("https://de", "de-DE"),
                 )
-        self.assertEqual(result, "de-DE")
+        for url, language in cases:
+            with self.subTest(url=url):
+                self.assertEqual(
+                        self.detect_language(url), language
+                        )
 
-        # Test detecting language from a URL with a TLD that is not in the
-        # referer json
-        result = self.header._Header__detect_language(
-                "https://www.example.fr"
+    def test_detect_language_templates(self):
+        # Test detecting language with the shipped referer templates.
+        cases = (
+                ("https://www.example.co.uk", "en-GB"),
+                ("https://shop.example.de/cart?id=1", "de-DE"),
+                ("https://example.com.au", "en-AU"),
+                ("https://www.example.at", "de-AT"),
+                ("https://www.example.ch", "de-CH"),
+                ("https://www.example.fr/", "fr-FR"),
+                ("https://www.example.com.br", "pt-BR"),
+                ("https://www.example.co.jp", "ja-JP"),
+                ("https://www.example.com:8080/path", "en-US"),
+                ("https://WWW.EXAMPLE.DE", "de-DE"),
+                # Bare TLDs as hostname are looked up as a whole.
+                ("https://ca", "en-CA"),
+                ("https://co.uk", "en-GB"),
+                ("https://com.au", "en-AU"),
+                # Unknown or non-country TLDs fall back to 'en-US'.
+                ("https://www.example.org", "en-US"),
+                ("https://www.example.uk", "en-US"),
+                ("https://www.example.io", "en-US"),
                 )
-        self.assertEqual(result, "en-US")  # Should fallback to 'en-US'
+        for url, language in cases:
+            with self.subTest(url=url):
+                self.assertEqual(
+                        self.detect_language(url), language
+                        )
 
     def test_check_language(self):
         # Test language code without country code
-        result = self.header._Header__check_language("http://example.com",
-                                                     "en"
-                                                     )
+        result = self.check_language("http://example.com", "en")
         self.assertEqual(result, "en-US")
 
         # Test no dash in language code
-        result = self.header._Header__check_language("http://example.com",
-                                                     "enUS"
-                                                     )
+        result = self.check_language("http://example.com", "enUS")
         self.assertEqual(result, "en-US")
 
-    @patch('simple_header.core.LOGGER')
-    def test_check_language_warning(self, mock_logger):
+        # Test malformed language codes with misplaced dashes
+        for language in ("-de-DE", "en-US-", "de-", "-de", "d-e", "en--US"):
+            with self.subTest(language=language):
+                with self.assertLogs('simple_header.core', level='WARNING'):
+                    result = self.check_language("http://example.com",
+                                                 language
+                                                 )
+                self.assertEqual(result, "en-US")
+
+    def test_normalized_lang(self):
+        # Test the keys of the lookup table: language code with or
+        # without country code, lowercase and without separator dash.
+        for key, language in simple_header.core._NORMALIZED_LANG.items():
+            self.assertRegex(key, r"^[a-z]{2}(?:[a-z]{2})?$")
+            self.assertIn(key, (language[:2].lower(),
+                                language.replace("-", "").lower())
+                          )
+
+    def test_check_language_warning(self):
         # Test language code not recognized or supported
-        result = self.header._Header__check_language("http://example.com",
-                                                     "abc"
-                                                     )
+        with self.assertLogs('simple_header.core', level='WARNING') as cm:
+            result = self.check_language("http://example.com", "abc")
         self.assertEqual(result, "en-US")
-        mock_logger.warning.assert_called_once_with(
-                "Language code 'abc' is not recognized or "
-                "unsupported! Falling back to default language "
-                "'en-US'."
-                )
+        self.assertEqual(cm.records[0].getMessage(),
+                         "Language code 'abc' is not recognized or "
+                         "unsupported! Falling back to default language "
+                         "'en-US'."
+                         )
+        self.assertEqual(len(cm.records), 1)
 
-    @patch('simple_header.core.Header._Header__load_json')
-    def test_check_language2(self, mock_load_json):
-        # Mock the __load_json method to return a specific referer json
-        mock_load_json.return_value = {"com": ["en-US"], "de": ["de-DE"]}
+    @patch.dict('simple_header.core._NORMALIZED_LANG',
+                {"enus": "en-US", "en": "en-US",
+                 "dede": "de-DE", "de": "de-DE"},
+                clear=True
+                )
+    def test_check_language2(self):
+        # Patch the lookup table to contain only a specific referer json
+        # ({"com": ["en-US"], "de": ["de-DE"]}).
 
         # Test checking a supported language
-        result = self.header._Header__check_language(self.url, "en-US")
+        result = self.check_language(self.url, "en-US")
         self.assertEqual(result, "en-US")
 
         # Test checking a language that is not supported
-        result = self.header._Header__check_language(self.url, "fr-FR")
+        result = self.check_language(self.url, "fr-FR")
         self.assertEqual(result, "en-US")  # Should fall back to 'en-US'
 
         # Test checking a language that is not in the referer json
-        result = self.header._Header__check_language(self.url, "es-ES")
+        result = self.check_language(self.url, "es-ES")
         self.assertEqual(result, "en-US")  # Should fall back to 'en-US'
 
         # Test auto-detecting the language from the TLD of the url
-        result = self.header._Header__check_language(
-                "https://www.example.de"
-                )
+        result = self.check_language("https://www.example.de")
         self.assertEqual(result, "de-DE")
 
     def test_check_user_agent(self):
         # Test checking a supported user agent
-        result = self.header._Header__check_user_agent(
-                simple_header.sua.UserAgent(
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 ("
-                        "KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
-                        )
-                )
+        result = self.check_user_agent(UA_CHROME_WIN)
         self.assertIsInstance(result, simple_header.sua.UserAgent)
 
         # Test checking a user agent that is not supported
         with self.assertLogs('simple_header.core', level='WARNING') as cm:
-            result = self.header._Header__check_user_agent(12345)
+            result = self.check_user_agent(12345)
             self.assertIsInstance(result, simple_header.sua.UserAgent)
 
         # Test checking a user agent that is not in the referer json
-        result = self.header._Header__check_user_agent(
+        result = self.check_user_agent(
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                 "AppleWebKit/537.36 ("
                 "KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
@@ -371,403 +555,276 @@ class TestHeader(unittest.TestCase):
         self.assertIsInstance(result, simple_header.sua.UserAgent)
 
         # Test auto-detecting the user agent from the TLD of the url
-        result = self.header._Header__check_user_agent(None)
+        result = self.check_user_agent(None)
         self.assertIsInstance(result, simple_header.sua.UserAgent)
 
-    def test_host(self):
-        # Test extracting host from a URL with http protocol
-        result = self.header._Header__host("http://www.example.com")
-        self.assertEqual(result, "www.example.com")
-
-        # Test extracting host from a URL with https protocol
-        result = self.header._Header__host("https://www.example.com")
-        self.assertEqual(result, "www.example.com")
-
-        # Test extracting host from a URL without www
-        result = self.header._Header__host("https://example.com")
-        self.assertEqual(result, "example.com")
-
-        # Test extracting host from a URL with path
-        result = self.header._Header__host("https://www.example.com/path")
-        self.assertEqual(result, "www.example.com")
+    def test_check_user_agent_cached(self):
+        # Test that the parsed user agent strings are cached, but every
+        # call returns a new object, so modifications do not leak.
+        first = self.check_user_agent(UA_CHROME_MAC_STRING)
+        first.browser_version = "1"
+        second = self.check_user_agent(UA_CHROME_MAC_STRING)
+        self.assertIsNot(first, second)
+        parsed = simple_header.sua.parse(UA_CHROME_MAC_STRING)
+        self.assertEqual(second.__dict__(), parsed.__dict__())
 
-        # Test extracting host from a URL with query parameters
-        result = self.header._Header__host(
-                "https://www.example.com/path?param=value"
+    def test_host(self):
+        cases = (
+                # Test extracting host from a URL with http protocol
+                ("http://www.example.com", "www.example.com"),
+                # Test extracting host from a URL with https protocol
+                ("https://www.example.com", "www.example.com"),
+                # Test extracting host from a URL without www
+                ("https://example.com", "example.com"),
+                # Test extracting host from a URL with path
+                ("https://www.example.com/path", "www.example.com"),
+                # Test extracting host from a URL with query parameters
+                ("https://www.example.com/path?param=value",
+                 "www.example.com"),
+                # Test extracting host from a URL with fragment
+                ("https://www.example.com/path#fragment", "www.example.com"),
                 )
-        self.assertEqual(result, "www.example.com")
+        for url, host in cases:
+            with self.subTest(url=url):
+                self.assertEqual(self.host(url), host)
 
-        # Test extracting host from a URL with fragment
-        result = self.header._Header__host(
-                "https://www.example.com/path#fragment"
+    @patch.dict('simple_header.core._LANG_TLD',
+                {"en-us": "com", "en-au": "com.au", "de-de": "de"},
+                clear=True
                 )
-        self.assertEqual(result, "www.example.com")
-
-    @patch('simple_header.core.Header._Header__load_json')
-    def test_referer(self, mock_load_json):
-        # Mock the __load_json method to return the contents of the
-        # referer_templates.json file
-        mock_load_json.return_value = {
-                "com": ["en-US", "https://google.com/",
-                        "https://www.facebook.com/"],
-                "com.au": ["en-AU", "https://google.com.au/",
-                           "https://www.facebook.com.au/"],
-                "de": ["de-DE", "https://google.de/",
-                       "https://www.facebook.de/"]
-                }
-
-        # Test generating referer from a URL with a .com TLD
-        result = self.header._Header__referer("https://www.example.com",
-                                              "en-US"
-                                              )
-        self.assertIn("https://www.example.com/", result)
-        self.assertIn("https://google.com/", result)
-        self.assertIn("https://www.facebook.com/", result)
-
-        # Test generating referer from a URL with a .com.au TLD
-        result = self.header._Header__referer("https://www.example.com.au",
-                                              "en-AU"
-                                              )
-        self.assertIn("https://www.example.com.au/", result)
-        self.assertIn("https://google.com.au/", result)
-        self.assertIn("https://www.facebook.com.au/", result)
-
-        # Test generating referer from a URL with a .de TLD
-        result = self.header._Header__referer("https://www.example.de",
-                                              "de-DE"
-                                              )
-        self.assertIn("https://www.example.de/", result)
-        self.assertIn("https://google.de/", result)
-        self.assertIn("https://www.facebook.de/", result)
+    @patch.dict('simple_header.core._TLD_REFERERS',
+                {"com": ("https://google.com/",
+                         "https://www.facebook.com/"),
+                 "com.au": ("https://google.com.au/",
+                            "https://www.facebook.com.au/"),
+                 "de": ("https://google.de/",
+                        "https://www.facebook.de/")},
+                clear=True
+                )
+    def test_referer(self):
+        cases = (
+                # Test generating referer from a URL with a .com TLD
+                ("https://www.example.com", "en-US", "com"),
+                # Test generating referer from a URL with a .com.au TLD
+                ("https://www.example.com.au", "en-AU", "com.au"),
+                # Test generating referer from a URL with a .de TLD
+                ("https://www.example.de", "de-DE", "de"),
+                )
+        for url, language, tld in cases:
+            with self.subTest(url=url):
+                result = self.referer(url, language)
+                self.assertIn(f"{url}/", result)
+                self.assertIn(f"https://google.{tld}/", result)
+                self.assertIn(f"https://www.facebook.{tld}/", result)
 
         # Test generating referer from a URL with a TLD that is not in the
         # referer json
-        result = self.header._Header__referer("https://www.example.fr",
-                                              "fr-FR"
-                                              )
+        result = self.referer("https://www.example.fr", "fr-FR")
         self.assertIn("https://www.example.fr/", result)
         self.assertNotIn("https://google.fr/", result)
         self.assertNotIn("https://www.facebook.fr/", result)
 
     def test_upgrade_insecure_requests(self):
         # Test upgrading insecure requests from a URL with http protocol
-        result = self.header._Header__upgrade_insecure_requests(
+        result = self.upgrade_insecure_requests(
                 "http://www.example.com"
                 )
         self.assertEqual(result, "0")
 
         # Test upgrading insecure requests from a URL with https protocol
-        result = self.header._Header__upgrade_insecure_requests(
+        result = self.upgrade_insecure_requests(
                 "https://www.example.com"
                 )
         self.assertEqual(result, "1")
 
-    def test_sec_ch_ua_chromium(self):
-        # Test extracting Chromium version from a user agent with Chromium
-        result = self.header._Header__sec_ch_ua_chromium(
-                simple_header.sua.UserAgent(
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 ("
-                        "KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
-                        )
+        # Test the protocol is matched case-insensitive
+        result = self.upgrade_insecure_requests(
+                "HTTP://www.example.com"
                 )
-        self.assertEqual(result, "58")
-
-        # Test extracting Chromium version from a user agent without Chromium
-        result = self.header._Header__sec_ch_ua_chromium(
-                simple_header.sua.UserAgent(
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 ("
-                        "KHTML, like Gecko) Safari/537.3"
-                        )
+        self.assertEqual(result, "0")
+
+    def test_sec_ch_ua_chromium(self):
+        cases = (
+                # Test extracting Chromium version from a user agent with
+                # Chromium
+                (UA_CHROME_WIN, "58"),
+                # Test extracting Chromium version from a user agent without
+                # Chromium
+                (UA_NO_CHROMIUM, ""),
+                # Test extracting Chromium version from a user agent with a
+                # different Chromium version
+                (UA_CHROME_WIN_60, "60"),
                 )
-        self.assertEqual(result, "")
-
-        # Test extracting Chromium version from a user agent with a
-        # different Chromium version
-        result = self.header._Header__sec_ch_ua_chromium(
-                simple_header.sua.UserAgent(
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 ("
-                        "KHTML, like Gecko) Chrome/60.0.3112.113 Safari/537.3"
+        for user_agent, version in cases:
+            with self.subTest(user_agent=user_agent.string):
+                self.assertEqual(
+                        simple_header.core._sec_ch_ua_chromium(
+                                user_agent_string=user_agent.string,
+                                browser_version=user_agent.browser_version,
+                                ),
+                        version
                         )
-                )
-        self.assertEqual(result, "60")
 
     def test_sec_ch_ua(self):
-        # Test generating Sec-Ch-Ua headers for a Chrome user agent
-        result = self.header._Header__sec_ch_ua(simple_header.sua.UserAgent(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 ("
-                "KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
+        cases = (
+                # Test generating Sec-Ch-Ua headers for a Chrome user agent
+                (UA_CHROME_WIN,
+                 ('"Not A(Brand";v="99", "Chromium";v="58", '
+                  '"Google Chrome";v="58"', "?0", "Windows")),
+                # Test Sec-Ch-Ua headers for Firefox and Safari user agents
+                # (no Sec-Ch-Ua headers)
+                (UA_FIREFOX, (None, None, None)),
+                (UA_SAFARI, (None, None, None)),
+                # Test Edge browser.
+                (UA_EDGE,
+                 ('"Not A(Brand";v="99", "Microsoft Edge";v="16", '
+                  '"Chromium";v="58"', "?0", "Windows")),
+                # Test Whale browser.
+                (UA_WHALE,
+                 ('"Whale";v="3", "Not-A.Brand";v="8", "Chromium";v="120"',
+                  "?0", "Windows")),
+                # Test Opera browser.
+                (UA_OPERA,
+                 ('"Not_A Brand";v="8", "Chromium";v="120", "Opera";v="106"',
+                  "?0", "Windows")),
+                # Test QQ browser.
+                (UA_QQ,
+                 ('"Not A;Brand";v="11", "Chromium";v="94", '
+                  '"QQ Browser";v="11"', "?0", "Windows")),
                 )
-                )
-        self.assertEqual(result[0],
-                         (
-                                 '"Not A(Brand";v="99", "Chromium";v="58", '
-                                 '"Google Chrome";v="58"')
-                         )
-        self.assertEqual(result[1], "?0")
-        self.assertEqual(result[2], "Windows")
-
-        # Test Sec-Ch-Ua headers for Firefox user agent (no Sec-Ch-Ua
-        # headers)
-        result = self.header._Header__sec_ch_ua(simple_header.sua.UserAgent(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:60.0) "
-                "Gecko/20100101 Firefox/60.0"
-                )
-                )
-        self.assertIsNone(result[0])
-        self.assertEqual(result[1], None)
-        self.assertEqual(result[2], None)
-
-        # Test generating Sec-Ch-Ua headers for a Safari user agent
-        result = self.header._Header__sec_ch_ua(simple_header.sua.UserAgent(
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_13_6) "
-                "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/11.1.2 "
-                "Safari/605.1.15"
-                )
-                )
-        self.assertIsNone(result[0])
-        self.assertEqual(result[1], None)
-        self.assertEqual(result[2], None)
-
-        # Test Edge browser.
-        edge_ua = simple_header.sua.parse(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 "
-                "Safari/537.3 Edge/16.16299"
-                )
-        result = self.header._Header__sec_ch_ua(edge_ua)
-        self.assertEqual(result[0],
-                         '"Not A(Brand";v="99", "Microsoft '
-                         'Edge";v="16", "Chromium";v="58"'
-                         )
-
-        # Test Whale browser.
-        whale_ua = simple_header.sua.parse(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 "
-                "Whale/3.24.223.21 Safari/537.36"
-                )
-        result = self.header._Header__sec_ch_ua(whale_ua)
-        self.assertEqual(result[0],
-                         '"Whale";v="3", "Not-A.Brand";v="8", '
-                         '"Chromium";v="120"'
-                         )
+        for user_agent, sec_ch_ua in cases:
+            with self.subTest(user_agent=user_agent.string):
+                self.assertEqual(
+                        self.sec_ch_ua(user_agent),
+                        sec_ch_ua
+                        )
 
-        # Test Opera browser.
-        opera_ua = simple_header.sua.parse(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 "
-                "Safari/537.36 OPR/106.0.0.0"
-                )
-        result = self.header._Header__sec_ch_ua(opera_ua)
-        self.assertEqual(result[0],
-                         '"Not_A Brand";v="8", "Chromium";v="120", '
-                         '"Opera";v="106"'
-                         )
+    def _generate(self, header, **overrides):
+        # Call generate() with the fixture parameters, except overrides.
+        kwargs = dict(url=self.url,
+                      language=self.language,
+                      user_agent=self.user_agent_string,
+                      mobile=self.mobile,
+                      seed=self.seed,
+                      intra_site_nav=self.intra_site_nav,
+                      _internal=False,
+                      )
+        kwargs.update(overrides)
 
-        # Test QQ browser.
-        qq_ua = simple_header.sua.parse(
-                "Mozilla/5.0 (Windows NT 10.0; WOW64) AppleWebKit/537.36 ("
-                "KHTML, like Gecko) Chrome/94.0.4606.71 Safari/537.36 "
-                "Core/1.94.192.400 QQBrowser/11.5.5250.400"
-                )
-        result = self.header._Header__sec_ch_ua(qq_ua)
-        self.assertEqual(result[0],
-                         '"Not A;Brand";v="11", "Chromium";v="94", '
-                         '"QQ Browser";v="11"'
-                         )
+        return header.generate(**kwargs)
 
     def test_generate(self):
-        # Setup.
-        header = simple_header.Header(
-                url=self.url,
-                language=self.language,
-                user_agent=self.user_agent,
-                mobile=self.mobile,
-                seed=self.seed,
-                intra_site_nav=self.intra_site_nav,
-                )
+        # Setup, generate() changes the instance, so work on a copy.
+        header = copy.copy(self.header)
 
         # Test with all parameters provided
-        header.generate(
-                url=self.url,
-                language=self.language,
-                user_agent=self.user_agent,
-                mobile=self.mobile,
-                seed=self.seed,
-                intra_site_nav=self.intra_site_nav,
-                _internal=False
-                )
-
-        self.assertIsInstance(header.dict, dict)
-        self.assertEqual(header.dict['Host'], self.host)
-        self.assertEqual(header.dict['Connection'], self.connection)
-        self.assertEqual(header.dict['Cache-Control'], self.cache_control)
-        self.assertEqual(header.dict['Sec-Ch-Ua'], self.sec_ch_ua)
-        self.assertEqual(header.dict['Sec-Ch-Ua-Mobile'],
-                         self.sec_ch_ua_mobile
-                         )
-        self.assertEqual(header.dict['Sec-Ch-Ua-Platform'],
-                         self.sec_ch_ua_platform
-                         )
-        self.assertEqual(header.dict['Upgrade-Insecure-Requests'],
-                         self.upgrade_insecure_requests
-                         )
-        self.assertEqual(header.dict['User-Agent'],
-                         self.user_agent_string
-                         )
-        self.assertEqual(header.dict['Accept'], self.accept)
-        self.assertEqual(header.dict['Sec-Fetch-Site'],
-                         self.sec_fetch_site
-                         )
-        self.assertEqual(header.dict['Sec-Fetch-Mode'],
-                         self.sec_fetch_mode
-                         )
-        self.assertEqual(header.dict['Sec-Fetch-User'],
-                         self.sec_fetch_user
-                         )
-        self.assertEqual(header.dict['Sec-Fetch-Dest'],
-                         self.sec_fetch_dest
-                         )
-        self.assertEqual(header.dict['Accept-Encoding'],
-                         self.accept_encoding
-                         )
-        self.assertEqual(header.dict['Accept-Language'],
-                         self.accept_language
+        self._generate(header, user_agent=self.user_agent)
+        self.assertIs(type(header.dict), dict)
+        self.assertEqual({key: header.dict[key] for key in self.expected_dict},
+                         self.expected_dict
                          )
 
         # Test with no user_agent provided
-        header.generate(
-                url="https://www.example.com",
-                language="en-US",
-                user_agent=None,
-                mobile=False,
-                seed=1,
-                intra_site_nav=True,
-                _internal=False
-                )
-        self.assertIsInstance(header.dict, dict)
+        self._generate(header, user_agent=None)
+        self.assertIs(type(header.dict), dict)
         self.assertIsNotNone(header.dict['User-Agent'])
 
         # Test with no language provided (test auto-detect).
-        header.generate(
-                url="https://www.example.com.au",
-                language=None,
-                user_agent=self.user_agent_string,
-                mobile=False,
-                seed=1,
-                intra_site_nav=True,
-                _internal=False
-                )
-        self.assertIsInstance(header.dict, dict)
+        self._generate(header, url="https://www.example.com.au", language=None)
+        self.assertIs(type(header.dict), dict)
         self.assertIsNotNone(header.dict['Accept-Language'])
         self.assertIn("en-AU", header.dict['Accept-Language'])
 
         # Test with mobile set to True, for testing sec_ch_ua we need
         # a Chrome browser.
-
-        while True:
-            mobile_ua = simple_header.sua.get(num=10,
-                                              mobile=True,
-                                              shuffle=True
-                                              )[0]
-            self.header_mobile = simple_header.Header(
-                    url="https://www.example.com",
-                    user_agent=mobile_ua,
-                    seed=1,
-                    )
-
-            result_dict = self.header_mobile.generate(
-                    url="https://www.example.com",
-                    language="en-US",
-                    user_agent=mobile_ua,
-                    mobile=True,
-                    seed=1,
-                    intra_site_nav=True,
-                    _internal=False
-                    )
-
-            if (self.header_mobile.user_agent.mobile and
-                    self.header_mobile.user_agent.browser == "Chrome"
-                    and self.header_mobile.user_agent.os != "iOS"):
-                break
-
-        self.assertIsInstance(result_dict, dict)
-        self.assertEqual(self.header_mobile['Sec-Ch-Ua-Mobile'], "?1")
-        self.assertEqual(result_dict['Sec-Ch-Ua-Mobile'], "?1")
-
-        # Test with intra_site_nav set to False
-        header.generate(
+        header_mobile = simple_header.Header(
                 url="https://www.example.com",
-                language="en-US",
-                user_agent=self.user_agent_string,
-                mobile=False,
+                user_agent=UA_CHROME_ANDROID,
                 seed=1,
-                intra_site_nav=False,
-                _internal=False
                 )
-        self.assertIsInstance(header.dict, dict)
+        result_dict = self._generate(header_mobile,
+                                     user_agent=UA_CHROME_ANDROID,
+                                     mobile=True
+                                     )
+        self.assertIs(type(result_dict), dict)
+        self.assertEqual(header_mobile['Sec-Ch-Ua-Mobile'], "?1")
+        self.assertEqual(result_dict['Sec-Ch-Ua-Mobile'], "?1")
+
+        # Test with intra_site_nav set to False
+        self._generate(header, intra_site_nav=False)
+        self.assertIs(type(header.dict), dict)
         self.assertNotEqual(header.dict['Referer'],
                             "https://www.example.com/"
                             )
 
         # Test with intra_site_nav set to True, referer should be
         # the same as the url.
-        header.generate(
-                url="https://www.example.com",
-                language="en-US",
-                user_agent=self.user_agent_string,
-                mobile=False,
-                seed=1,
-                intra_site_nav=True,
-                _internal=False
-                )
-        self.assertIsInstance(header.dict, dict)
+        self._generate(header)
+        self.assertIs(type(header.dict), dict)
         self.assertEqual(header.dict['Referer'],
                          "https://www.example.com/"
                          )
 
     def test_generate_first_element(self):
         # Generate headers with seed=None to select the first element
-        self.header.generate(
-                url="http://example.com",
-                language="en-US",
-                user_agent="Mozilla/5.0",
-                mobile=False,
-                seed=None,
-                intra_site_nav=False,
-                _internal=False
-                )
+        header = copy.copy(self.header)
+        self._generate(header,
+                       url="http://example.com",
+                       user_agent="Mozilla/5.0",
+                       seed=None,
+                       intra_site_nav=False
+                       )
         # Check if the first element is selected for headers with multiple
         # options
-        self.assertEqual(self.header.accept_encoding,
-                         ['gzip, deflate', 'gzip, deflate, br']
+        self.assertEqual(header.accept_encoding,
+                         ('gzip, deflate', 'gzip, deflate, br')
                          )
-        self.assertEqual(self.header.accept_language,
-                         ['en-US,en;q=0.5', 'en-US,en;q=0.9']
+        self.assertEqual(header.accept_language,
+                         ('en-US,en;q=0.5', 'en-US,en;q=0.9')
                          )
 
 
 class TestHeaders(unittest.TestCase):
-    def setUp(self):
-        self.headers = simple_header.Headers()
-        self.url = "https://www.example.com"
-        self.language = "en-US"
-        self.mobile = False
-        self.seed = 1
-        self.intra_site_nav = True
-        self.user_agent_string = (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/110.0.0.0 Safari/537.36"
-        )
-        self.user_agent = simple_header.sua.parse(self.user_agent_string)
+    @classmethod
+    def setUpClass(cls):
+        cls.headers = simple_header.Headers()
+        cls.url = "https://www.example.com"
+        cls.language = "en-US"
+        cls.mobile = False
+        cls.seed = 1
+        cls.intra_site_nav = True
+        cls.user_agent_string = UA_CHROME_MAC_STRING
+        cls.user_agent = UA_CHROME_MAC
+
+    def assert_headers(self, headers, params, language):
+        # Check a header dictionary against the parameters of a scenario.
+        url = params["url"]
+        user_agent = params["user_agent"]
+
+        self.assertIs(type(headers), dict)
+        self.assertEqual(headers['Host'], url.split("://", 1)[1])
+        if user_agent is None:
+            self.assertTrue(headers['User-Agent'])
+        else:
+            self.assertEqual(headers['User-Agent'],
+                             getattr(user_agent, "string", user_agent)
+                             )
+        self.assertIn(language, headers['Accept-Language'])
+        if params["mobile"]:
+            self.assertEqual(headers['Sec-Ch-Ua-Mobile'], "?1")
+        if params["intra_site_nav"]:
+            self.assertEqual(headers['Referer'], f"{url}/")
+        else:
+            self.assertNotEqual(headers['Referer'], f"{url}/")
 
     def test_get_dict(self):
-        # Test with all parameters provided
+        for name, params, language in HEADERS_SCENARIOS:
+            with self.subTest(scenario=name):
+                result_dict = self.headers.get_dict(**params)
+                self.assert_headers(result_dict, params, language)
+
+    def test_get_dict_cached(self):
+        # Same parameters return equal, but independent dictionaries.
         result_dict = self.headers.get_dict(
                 url=self.url,
                 language=self.language,
@@ -776,277 +833,207 @@ class TestHeaders(unittest.TestCase):
                 seed=self.seed,
                 intra_site_nav=self.intra_site_nav
                 )
-        self.assertIsInstance(result_dict, dict)
-        self.assertEqual(result_dict['Host'], 'www.example.com')
-        self.assertEqual(result_dict['User-Agent'], self.user_agent_string)
-
-        # Test with no user_agent provided
-        result_dict = self.headers.get_dict(
-                url="https://www.example.com",
-                language="en-US",
-                user_agent=None,
-                mobile=False,
-                seed=1,
-                intra_site_nav=True
-                )
-        self.assertIsInstance(result_dict, dict)
-        self.assertIsNotNone(result_dict['User-Agent'])
-
-        # Test with no language provided (test auto-detect).
-        result_dict = self.headers.get_dict(
-                url="https://www.example.com.au",
-                language=None,
+        result_dict["Host"] = "modified"
+        result_dict_2 = self.headers.get_dict(
+                url=self.url,
+                language=self.language,
                 user_agent=self.user_agent_string,
-                mobile=False,
-                seed=1,
-                intra_site_nav=True
+                mobile=self.mobile,
+                seed=self.seed,
+                intra_site_nav=self.intra_site_nav
                 )
-        self.assertIsInstance(result_dict, dict)
-        self.assertIsNotNone(result_dict['Accept-Language'])
-        self.assertIn("en-AU", result_dict['Accept-Language'])
-
-        # Test with mobile set to True
-        while True:
-            mobile_ua = simple_header.sua.get(num=10,
-                                              mobile=True,
-                                              shuffle=True
-                                              )[0]
-            result_dict = self.headers.get_dict(
-                    url="https://www.example.com",
-                    language="en-US",
-                    user_agent=mobile_ua,
-                    mobile=True,
-                    seed=1,
-                    intra_site_nav=True
-                    )
-            if (mobile_ua.mobile and
-                    mobile_ua.browser == "Chrome" and
-                    mobile_ua.os != "iOS"):
-                break
-        self.assertIsInstance(result_dict, dict)
-        self.assertEqual(result_dict['Sec-Ch-Ua-Mobile'], "?1")
+        self.assertIsNot(result_dict, result_dict_2)
+        self.assertEqual(result_dict_2['Host'], 'www.example.com')
 
-        # Test with intra_site_nav set to False
-        result_dict = self.headers.get_dict(
-                url="https://www.example.com",
-                language="en-US",
+        # Without intra-site navigation, only the referer is random.
+        result_dict_3 = self.headers.get_dict(
+                url=self.url,
+                language=self.language,
                 user_agent=self.user_agent_string,
-                mobile=False,
-                seed=1,
+                mobile=self.mobile,
+                seed=self.seed,
                 intra_site_nav=False
                 )
-        self.assertIsInstance(result_dict, dict)
-        self.assertNotEqual(result_dict['Referer'], "https://www.example.com/")
-
-        # Test with intra_site_nav set to True, referer should be the same
-        # as the url.
-        result_dict = self.headers.get_dict(
-                url="https://www.example.com",
-                language="en-US",
-                user_agent=self.user_agent_string,
-                mobile=False,
-                seed=1,
-                intra_site_nav=True
-                )
-        self.assertIsInstance(result_dict, dict)
-        self.assertEqual(result_dict['Referer'], "https://www.example.com/")
-
-    def test_get_list(self):
-        # Test with all parameters provided
-        result_list = self.headers.get_list(
+        self.assertEqual(list(result_dict_3), list(result_dict_2))
+        self.assertNotEqual(result_dict_3['Referer'],
+                            'https://www.example.com/'
+                            )
+        del result_dict_2['Referer'], result_dict_3['Referer']
+        self.assertEqual(result_dict_3, result_dict_2)
+
+        # Modified UserAgent objects are used as is, not parsed again.
+        user_agent = simple_header.sua.parse(UA_CHROME_MAC_STRING)
+        user_agent.os = "Linux"
+        result_dict_4 = self.headers.get_dict(url=self.url,
+                                              user_agent=user_agent
+                                              )
+        self.assertEqual(result_dict_4["Sec-Ch-Ua-Platform"], "Linux")
+        result_dicts = self.headers.get_dicts(urls=[self.url],
+                                              user_agent=user_agent
+                                              )
+        self.assertEqual(result_dicts[0]["Sec-Ch-Ua-Platform"], "Linux")
+
+        # Invalid urls raise the same error as without the cache.
+        for url in (["https://www.example.com"], 12345):
+            with self.subTest(url=url):
+                with self.assertLogs('simple_header.core', level='ERROR'):
+                    with self.assertRaises(
+                            simple_header.exceptions.InvalidURLError):
+                        self.headers.get_dict(
+                                url=url,
+                                user_agent=self.user_agent_string
+                                )
+
+    def test_cache_clear(self):
+        self.headers.get_dict(
                 url=self.url,
                 language=self.language,
-                user_agent=self.user_agent,
+                user_agent=self.user_agent_string,
                 mobile=self.mobile,
-                num=7,
+                seed=self.seed,
                 intra_site_nav=self.intra_site_nav
                 )
-        self.assertIsInstance(result_list, list)
-        self.assertEqual(len(result_list), 7)
-        self.assertIsInstance(result_list[0], simple_header.Header)
-        self.assertEqual(result_list[0]['Host'], 'www.example.com')
-        self.assertEqual(result_list[0]['User-Agent'],
-                         self.user_agent
-                         )
-        self.assertEqual(result_list[0]['User-Agent'].string,
-                         self.user_agent_string
-                         )
-
-        # Test with no user_agent provided
-        result_list = self.headers.get_list(
-                url="https://www.example.com",
-                language="en-US",
-                user_agent=None,
-                mobile=False,
-                num=1,
-                intra_site_nav=True
+        self.assertGreater(
+                simple_header.core._cached_dict.cache_info().currsize, 0
                 )
-        self.assertIsInstance(result_list, list)
-        self.assertEqual(len(result_list), 1)
-        self.assertIsInstance(result_list[0], simple_header.Header)
-        self.assertIsNotNone(result_list[0]['User-Agent'])
 
-        # Test with no language provided (test auto-detect).
-        result_list = self.headers.get_list(
-                url="https://www.example.com.au",
-                language=None,
-                user_agent=self.user_agent_string,
-                mobile=False,
-                num=23,
-                intra_site_nav=True
+        self.headers.cache_clear()
+        self.assertEqual(
+                simple_header.core._cached_dict.cache_info().currsize, 0
+                )
+        self.assertEqual(
+                simple_header.core._parse_user_agent.cache_info().currsize, 0
                 )
-        self.assertIsInstance(result_list, list)
-        self.assertEqual(len(result_list), 23)
-        self.assertIsInstance(result_list[0], simple_header.Header)
-        self.assertIsNotNone(result_list[0]['Accept-Language'])
-        self.assertIn("en-AU", result_list[0]['Accept-Language'][0])
 
-        # Test with mobile set to True
-        while True:
-            mobile_ua = simple_header.sua.get(num=10,
-                                              mobile=True,
-                                              shuffle=True
-                                              )[0]
-            result_list = self.headers.get_list(
-                    url="https://www.example.com",
-                    language="en-US",
-                    user_agent=mobile_ua,
-                    mobile=True,
-                    num=4,
+    def test_get_dict_seed_ranking(self):
+        # Combinations are ranked by the number of header values
+        # deviating from the most common ones (seed 0).
+        def deviations(seed):
+            result_dict = self.headers.get_dict(
+                    url=self.url,
+                    language=self.language,
+                    user_agent=self.user_agent_string,
+                    seed=seed,
                     intra_site_nav=True
                     )
-            if (mobile_ua.mobile and
-                    mobile_ua.browser == "Chrome" and
-                    mobile_ua.os != "iOS"):
-                break
-        self.assertIsInstance(result_list, list)
-        self.assertEqual(len(result_list), 4)
-        self.assertIsInstance(result_list[0], simple_header.Header)
-        self.assertEqual(result_list[0]['Sec-Ch-Ua-Mobile'], "?1")
-        self.assertEqual(result_list[0].user_agent.mobile, True)
-        self.assertEqual(result_list[0].user_agent.browser, "Chrome")
-        self.assertNotEqual(result_list[0].user_agent.os, "iOS")
+            return sum(value != first[key]
+                       for key, value in result_dict.items())
 
-        # Test with intra_site_nav set to False
-        result_list = self.headers.get_list(
-                url="https://www.example.com",
-                language="en-US",
-                user_agent=self.user_agent_string,
-                mobile=False,
-                num=9,
-                intra_site_nav=False
-                )
-        self.assertIsInstance(result_list, list)
-        self.assertEqual(len(result_list), 9)
-        self.assertIsInstance(result_list[0], simple_header.Header)
-        self.assertNotEqual(result_list[0]['Referer'],
-                            "https://www.example.com/"
-                            )
-
-        # Test with intra_site_nav set to True, referer should be the same
-        # as the url. With maximal number of header combinations.
-        result_list = self.headers.get_list(
-                url="https://www.example.com",
-                language="en-US",
+        first = self.headers.get_dict(
+                url=self.url,
+                language=self.language,
                 user_agent=self.user_agent_string,
-                mobile=False,
-                num=720,
+                seed=0,
                 intra_site_nav=True
                 )
-        self.assertIsInstance(result_list, list)
-        self.assertEqual(len(result_list), 720)
-        self.assertIsInstance(result_list[0], simple_header.Header)
-        self.assertEqual(result_list[0]['Referer'][0],
-                         "https://www.example.com/"
-                         )
+        result = [deviations(seed) for seed in
+                  range(simple_header.core._NUM_COMBINATIONS)]
+        self.assertEqual(result, sorted(result))
+        self.assertEqual(result[:7], [0, 1, 1, 1, 1, 1, 1])
+        self.assertEqual(result[-1], 5)
 
-    def test_get(self):
+    def test_get_dicts(self):
         # Test with all parameters provided
-        result_header = self.headers.get(
-                url=self.url,
+        result_list = self.headers.get_dicts(
+                urls=[self.url, "https://www.example.de/index.html"],
                 language=self.language,
                 user_agent=self.user_agent,
                 mobile=self.mobile,
                 seed=self.seed,
                 intra_site_nav=self.intra_site_nav
                 )
-        self.assertIsInstance(result_header, simple_header.Header)
-        self.assertEqual(result_header.host, 'www.example.com')
-        self.assertEqual(result_header.user_agent, self.user_agent)
-        self.assertEqual(result_header.user_agent.string,
-                         self.user_agent_string
+        self.assertIsInstance(result_list, list)
+        self.assertEqual(len(result_list), 2)
+        self.assertEqual(result_list[0]['Host'], 'www.example.com')
+        self.assertEqual(result_list[1]['Host'], 'www.example.de')
+        self.assertEqual(result_list[1]['User-Agent'], self.user_agent_string)
+
+        # Test with no user agent and language provided: one random user
+        # agent for all urls, language detected per url.
+        result_list = self.headers.get_dicts(
+                urls=(url for url in ["https://www.example.com",
+                                      "https://www.example.de"]),
+                )
+        self.assertEqual(len(result_list), 2)
+        self.assertEqual(result_list[0]['User-Agent'],
+                         result_list[1]['User-Agent']
                          )
+        self.assertIn("en-US", result_list[0]['Accept-Language'])
+        self.assertIn("de-DE", result_list[1]['Accept-Language'])
 
-        # Test with no user_agent provided
-        result_header = self.headers.get(
+        # Test with no urls.
+        self.assertEqual(self.headers.get_dicts(urls=[]), [])
+
+    def test_get_list(self):
+        for name, params, language in HEADERS_SCENARIOS:
+            params = {key: value for key, value in params.items()
+                      if key != "seed"}
+            with self.subTest(scenario=name):
+                result_list = self.headers.get_list(**params, num=3)
+                self.assertIsInstance(result_list, list)
+                self.assertEqual(len(result_list), 3)
+                first = result_list[0]
+                self.assertIsInstance(first, simple_header.Header)
+                self.assert_headers(first.dict, params, language)
+
+        # Test with no user_agent provided, the random user agent is
+        # shared by all instances.
+        result_list = self.headers.get_list(
                 url="https://www.example.com",
                 language="en-US",
                 user_agent=None,
                 mobile=False,
-                seed=1,
+                num=3,
                 intra_site_nav=True
                 )
-        self.assertIsInstance(result_header, simple_header.Header)
-        self.assertIsNotNone(result_header.user_agent)
+        user_agent = result_list[0]['User-Agent']
+        self.assertEqual({header['User-Agent'].string
+                          for header in result_list},
+                         {user_agent.string}
+                         )
 
-        # Test with no language provided (test auto-detect).
-        result_header = self.headers.get(
-                url="https://www.example.com.au",
-                language=None,
-                user_agent=self.user_agent_string,
-                mobile=False,
-                seed=1,
-                intra_site_nav=True
-                )
-        self.assertIsInstance(result_header, simple_header.Header)
-        self.assertIsNotNone(result_header.accept_language)
-        self.assertIn("en-AU", result_header.accept_language[0])
+        # Test that every instance has its own referer list.
+        result_list[0].referer.append("https://www.example.org/")
+        for header in result_list[1:]:
+            self.assertNotIn("https://www.example.org/", header.referer)
 
-        # Test with mobile set to True
-        while True:
-            mobile_ua = simple_header.sua.get(num=10,
-                                              mobile=True,
-                                              shuffle=True
-                                              )[0]
-            result_header = self.headers.get(
+        # Test with intra_site_nav set to True, referer should be the same
+        # as the url. More instances than header combinations requested.
+        with self.assertLogs('simple_header.core', level='WARNING'):
+            result_list = self.headers.get_list(
                     url="https://www.example.com",
                     language="en-US",
-                    user_agent=mobile_ua,
-                    mobile=True,
-                    seed=1,
+                    user_agent=self.user_agent_string,
+                    mobile=False,
+                    num=simple_header.core._NUM_COMBINATIONS + 1,
                     intra_site_nav=True
                     )
-            if (mobile_ua.mobile and
-                    mobile_ua.browser == "Chrome" and
-                    mobile_ua.os != "iOS"):
-                break
-        self.assertIsInstance(result_header, simple_header.Header)
-        self.assertEqual(result_header.sec_ch_ua_mobile, "?1")
-
-        # Test with intra_site_nav set to False
-        result_header = self.headers.get(
-                url="https://www.example.com",
-                language="en-US",
-                user_agent=self.user_agent_string,
-                mobile=False,
-                seed=1,
-                intra_site_nav=False
-                )
-        self.assertIsInstance(result_header, simple_header.Header)
-        self.assertNotEqual(result_header.referer, "https://www.example.com/")
+        self.assertIsInstance(result_list, list)
+        self.assertEqual(len(result_list), 49)
+        self.assertEqual(len({tuple(header.dict.items())
+                              for header in result_list}), 48)
+        first = result_list[0]
+        self.assertIsInstance(first, simple_header.Header)
+        self.assertEqual(first['Referer'][0], "https://www.example.com/")
+        # The header value combinations wrap around after 48 seeds.
+        self.assertEqual(result_list[48].dict, first.dict)
+        self.assertNotEqual(result_list[47].dict, first.dict)
 
-        # Test with intra_site_nav set to True, referer should be the same
-        # as the url.
-        result_header = self.headers.get(
-                url="https://www.example.com",
-                language="en-US",
-                user_agent=self.user_agent_string,
-                mobile=False,
-                seed=1,
-                intra_site_nav=True
-                )
-        self.assertIsInstance(result_header, simple_header.Header)
-        self.assertEqual(result_header.referer[0], "https://www.example.com/")
+    def test_get(self):
+        for name, params, language in HEADERS_SCENARIOS:
+            with self.subTest(scenario=name):
+                result_header = self.headers.get(**params)
+                self.assertIsInstance(result_header, simple_header.Header)
+                self.assert_headers(result_header.dict, params, language)
+                user_agent = params["user_agent"]
+                if isinstance(user_agent, simple_header.sua.UserAgent):
+                    self.assertEqual(result_header.user_agent, user_agent)
+
+    def test_core_module(self):
+        # Test accessing the lazily imported core module by attribute,
+        # even before any of its names was accessed.
+        self.assertIs(simple_header.__getattr__("core"), simple_header.core)
+        self.assertNotIn("importlib", dir(simple_header))
 
 
 class LogListHandler(logging.Handler):
@@ -1060,7 +1047,8 @@ class LogListHandler(logging.Handler):
         self.log = []
 
     def emit(self, record):
-        self.log.append(self.format(record))
+        # Keep the raw record, format it only when inspected.
+        self.log.append(record)
 
 
 class TestPrintLogLeftover(unittest.TestCase):
@@ -1087,9 +1075,11 @@ class TestPrintLogLeftover(unittest.TestCase):
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_package_name():
         """
-        Get the package name dynamically for importing.
+        Get the package name dynamically for importing. The name does
+        not change while the tests run, so it is looked up only once.
 
         :return: The package name, e.g. 'simple_header.core'.
         :rtype: str
@@ -1106,7 +1096,31 @@ class TestPrintLogLeftover(unittest.TestCase):
 
         return f"{src_subs[0]}.{module_name}"
 
-    def import_package(self):
+    @classmethod
+    def setUpClass(cls):
+        """
+        Re-import the package once, capturing its standard output and
+        log messages for both tests.
+
+        :return: None
+        """
+
+        # Create a logger.
+        logger = logging.getLogger(cls.get_package_name())
+        logger.setLevel(logging.INFO)
+
+        # Create our handler and add it to the logger.
+        cls.handler = LogListHandler()
+        logger.addHandler(cls.handler)
+        cls.addClassCleanup(logger.removeHandler, cls.handler)
+
+        # Re-Import the package and redirect the standard output.
+        cls.stdout = io.StringIO()
+        with contextlib.redirect_stdout(cls.stdout):
+            cls.import_package()
+
+    @classmethod
+    def import_package(cls):
         """
         Import the package and reload it to ensure that the import of the
         package is successful.
@@ -1115,23 +1129,17 @@ class TestPrintLogLeftover(unittest.TestCase):
         """
 
         # Re-Import the module dynamically
-        imported_package = importlib.import_module(self.get_package_name())
+        imported_package = importlib.import_module(cls.get_package_name())
         importlib.reload(imported_package)
 
-    @patch('sys.stdout', new_callable=io.StringIO)
-    def test_print_leftover(self, mock_stdout):
+    def test_print_leftover(self):
         """
         Test if there are any print statements left in the package.
 
-        :param mock_stdout: Mocked or redirected standard output.
-        :type mock_stdout: MagicMock
         :return: None
         """
 
-        # Re-Import the package
-        self.import_package()
-
-        self.assertEqual(mock_stdout.getvalue(), "")
+        self.assertEqual(self.stdout.getvalue(), "")
 
     def test_log_during_import(self):
         """
@@ -1140,16 +1148,5 @@ class TestPrintLogLeftover(unittest.TestCase):
         :return: None
         """
 
-        # Create a logger.
-        logger = logging.getLogger(self.get_package_name())
-        logger.setLevel(logging.INFO)
-
-        # Create our handler and add it to the logger.
-        handler = LogListHandler()
-        logger.addHandler(handler)
-
-        # Re-Import the package.
-        self.import_package()
-
         # Check if any logs were triggered.
-        self.assertEqual(handler.log, [])
+        self.assertEqual(self.handler.log, [])